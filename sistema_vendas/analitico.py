@@ -0,0 +1,240 @@
+import math
+import threading
+import time
+from contextvars import copy_context
+
+import pyarrow as pa
+import streamlit as st
+from decouple import Choices, config
+
+from sistema_vendas.banco import consultar_arrow, get_db
+from sistema_vendas.cache_consultas import tabelas_lidas
+
+
+# Motor das consultas do dashboard: "sqlite" agrega direto no banco; "duckdb"
+# agrega, de forma vetorizada, uma cópia colunar das tabelas em memória
+# (exige o pacote opcional duckdb)
+MOTOR_ANALITICO = config("SISTEMA_VENDAS_MOTOR_ANALITICO", default="sqlite", cast=Choices(["sqlite", "duckdb"]))
+
+# Intervalo mínimo, em segundos, entre duas cópias de uma mesma tabela para o
+# DuckDB: depois de uma escrita, o dashboard pode mostrar dados com até esse
+# atraso (mais o tempo da cópia)
+ATUALIZACAO_DUCKDB_S = config("SISTEMA_VENDAS_DUCKDB_ATUALIZACAO_S", default=30, cast=float)
+
+# Tabelas copiadas para o DuckDB, só com as colunas usadas pelo dashboard:
+# tabela -> (SELECT no SQLite, esquema Arrow). As datas continuam texto ISO,
+# comparadas e agrupadas como no SQLite.
+TABELAS = {
+    "vendas_diarias": (
+        "SELECT tipo, dia, ano_mes, id_produto, quantidade, faturamento FROM vendas_diarias",
+        pa.schema([
+            ("tipo", pa.string()),
+            ("dia", pa.string()),
+            ("ano_mes", pa.string()),
+            ("id_produto", pa.int64()),
+            ("quantidade", pa.int64()),
+            ("faturamento", pa.float64()),
+        ]),
+    ),
+    "produtos": (
+        "SELECT id, marca, tamanho, preco_compra, data_compra, ano_mes FROM produtos",
+        pa.schema([
+            ("id", pa.int64()),
+            ("marca", pa.string()),
+            ("tamanho", pa.string()),
+            ("preco_compra", pa.float64()),
+            ("data_compra", pa.string()),
+            ("ano_mes", pa.string()),
+        ]),
+    ),
+    "clientes": ("SELECT id FROM clientes", pa.schema([("id", pa.int64())])),
+    "profissionais": ("SELECT id FROM profissionais", pa.schema([("id", pa.int64())])),
+}
+
+# Expressões de período no dialeto do DuckDB, com o mesmo resultado das de
+# consultas.GRANULARIDADES (no DuckDB `/` entre inteiros não trunca)
+GRANULARIDADES = {
+    "Dia": "{coluna}",
+    "Semana": "strftime(date_trunc('week', CAST({coluna} AS DATE)), '%Y-%m-%d')",  # segunda-feira da semana
+    "Mês": "ano_mes",
+    "Trimestre": "substr({coluna}, 1, 4) || '-T' || ((CAST(substr({coluna}, 6, 2) AS INTEGER) + 2) // 3)",
+}
+
+
+class MotorDuckDB:
+    # Banco DuckDB em memória com cópias colunares das tabelas do SQLite. Uma
+    # cópia desatualizada (pelas mesmas versões do cache de consultas) é refeita
+    # em segundo plano, no máximo a cada `intervalo_s` segundos; enquanto isso as
+    # consultas seguem na cópia anterior, sem esperar. Só a primeira cópia de
+    # cada tabela é feita na hora. As consultas usam cursores próprios, que o
+    # DuckDB permite usar em threads diferentes.
+    def __init__(self, intervalo_s=ATUALIZACAO_DUCKDB_S):
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError(
+                "SISTEMA_VENDAS_MOTOR_ANALITICO=duckdb requer o pacote duckdb (pip install duckdb)"
+            ) from e
+        self._conn = duckdb.connect(":memory:")
+        self._versoes = {}
+        self._copiado_em = {}
+        self.intervalo_s = intervalo_s
+        self._trava = threading.Lock()  # uma cópia por vez
+
+    # Versões do SQLite de que as cópias das tabelas foram feitas
+    def versoes(self, tabelas):
+        return tuple(self._versoes.get(tabela) for tabela in tabelas)
+
+    def _copiar(self, tabela, cache):
+        # Versão lida antes da cópia: uma escrita durante a leitura deixa a cópia desatualizada
+        versao = cache.versao(tabela)
+        query, esquema = TABELAS[tabela]
+        copia = consultar_arrow(query, esquema, em_cache=False)
+        # Cursor próprio: a troca da tabela é atômica para as consultas em andamento
+        cursor = self._conn.cursor()
+        try:
+            cursor.register("copia", copia)
+            cursor.execute(f"CREATE OR REPLACE TABLE {tabela} AS SELECT * FROM copia")
+        finally:
+            cursor.close()
+        self._versoes[tabela] = versao
+        self._copiado_em[tabela] = time.monotonic()
+
+    def _desatualizadas(self, tabelas, cache):
+        return [tabela for tabela in tabelas if self._versoes.get(tabela) != cache.versao(tabela)]
+
+    def atualizar(self, tabelas):
+        cache = get_db().cache
+        if any(tabela not in self._versoes for tabela in tabelas):
+            with self._trava:
+                for tabela in tabelas:
+                    if tabela not in self._versoes:
+                        self._copiar(tabela, cache)
+        agora = time.monotonic()
+        vencidas = [
+            tabela for tabela in self._desatualizadas(tabelas, cache)
+            if agora - self._copiado_em[tabela] >= self.intervalo_s
+        ]
+        # Já há uma cópia em andamento: ela ou a próxima consulta cuidam destas
+        if vencidas and self._trava.acquire(blocking=False):
+            try:
+                threading.Thread(
+                    target=copy_context().run, args=(self._atualizar_em_segundo_plano, vencidas, cache),
+                    name="duckdb-copia", daemon=True,
+                ).start()
+            except BaseException:
+                self._trava.release()
+                raise
+
+    def _atualizar_em_segundo_plano(self, tabelas, cache):
+        try:
+            for tabela in self._desatualizadas(tabelas, cache):
+                self._copiar(tabela, cache)
+        finally:
+            self._trava.release()
+
+    # Refaz na hora todas as cópias desatualizadas (comparação entre os motores)
+    def sincronizar(self, tabelas=TABELAS):
+        cache = get_db().cache
+        with self._trava:
+            for tabela in self._desatualizadas(tabelas, cache):
+                self._copiar(tabela, cache)
+
+    def consultar(self, query, params=None):
+        cursor = self._conn.cursor()
+        try:
+            inicio = time.perf_counter()
+            linhas = cursor.execute(query, params or ()).fetchall()
+            get_db().instrumentacao.registrar(f"/* duckdb */ {query}", time.perf_counter() - inicio, len(linhas))
+        finally:
+            cursor.close()
+        return linhas
+
+
+# Motor único por processo, como o gerenciador de conexões
+@st.cache_resource(show_spinner=False)
+def get_motor():
+    return MotorDuckDB()
+
+
+# Leitura pelo DuckDB com o mesmo cache de consultas das leituras do SQLite. A
+# chave inclui as versões das cópias usadas, para que o resultado calculado numa
+# cópia anterior saia do cache quando ela for refeita.
+def consultar(query, params=None):
+    db = get_db()
+    db.verificar_escritas_externas()
+    motor = get_motor()
+    tabelas = [tabela for tabela in tabelas_lidas(query) if tabela in TABELAS]
+    motor.atualizar(tabelas)
+    chave = (*db.cache.chave(query, params, tabelas_lidas(query)), "duckdb", motor.versoes(tabelas))
+    resultado = db.cache.obter(chave)
+    if resultado is None:
+        resultado = ((), motor.consultar(query, params))
+        db.cache.guardar(chave, resultado)
+    # Cópia da lista para que quem chamou não altere o resultado em cache
+    return list(resultado[1])
+
+
+def _linhas(resultado):
+    if hasattr(resultado, "itertuples"):
+        return list(resultado.itertuples(index=False, name=None))
+    return [tuple(resultado)]
+
+
+# Valores iguais nos dois motores; somas de números reais podem diferir na
+# última casa porque a ordem das parcelas muda
+def _iguais(valor_sqlite, valor_duckdb):
+    if isinstance(valor_sqlite, float) or isinstance(valor_duckdb, float):
+        return math.isclose(valor_sqlite, valor_duckdb, rel_tol=1e-9, abs_tol=1e-6)
+    return valor_sqlite == valor_duckdb
+
+
+# Executa as consultas do dashboard nos dois motores, em todas as granularidades,
+# e devolve as divergências: (consulta, granularidade, linha, valor SQLite, valor DuckDB)
+def comparar_motores(data_inicio, data_fim):
+    from sistema_vendas import consultas
+
+    tarefas = [(consultas.consultar_indicadores, None), (consultas.consultar_vendas_por_marca, None),
+               (consultas.consultar_vendas_por_tamanho, None)]
+    tarefas += [
+        (consulta, granularidade)
+        for consulta in (consultas.consultar_vendas_periodo, consultas.consultar_custos_periodo)
+        for granularidade in consultas.GRANULARIDADES
+    ]
+    # As duas leituras devem partir dos mesmos dados
+    get_motor().sincronizar()
+    divergencias = []
+    for consulta, granularidade in tarefas:
+        args = (data_inicio, data_fim) + ((granularidade,) if granularidade else ())
+        sqlite = _linhas(consulta(*args, motor="sqlite"))
+        duckdb = _linhas(consulta(*args, motor="duckdb"))
+        if len(sqlite) != len(duckdb):
+            divergencias.append((consulta.__name__, granularidade, "linhas", len(sqlite), len(duckdb)))
+            continue
+        for numero, (linha_sqlite, linha_duckdb) in enumerate(zip(sqlite, duckdb)):
+            if len(linha_sqlite) != len(linha_duckdb) or not all(map(_iguais, linha_sqlite, linha_duckdb)):
+                divergencias.append((consulta.__name__, granularidade, numero, linha_sqlite, linha_duckdb))
+    return divergencias
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from sistema_vendas.banco import init_db
+
+    parser = argparse.ArgumentParser(
+        description="Confere se SQLite e DuckDB devolvem os mesmos indicadores e gráficos do dashboard"
+    )
+    parser.add_argument("comando", choices=["comparar"])
+    parser.add_argument("--inicio", default="0000-01-01", help="data inicial (AAAA-MM-DD)")
+    parser.add_argument("--fim", default="9999-12-31", help="data final (AAAA-MM-DD)")
+    args = parser.parse_args()
+
+    init_db()
+    inicio = time.perf_counter()
+    divergencias = comparar_motores(args.inicio, args.fim)
+    for divergencia in divergencias:
+        print("Divergência: {} ({}) linha {}: SQLite={!r} DuckDB={!r}".format(*divergencia))
+    print(f"{len(divergencias)} divergências em {time.perf_counter() - inicio:.1f} s.")
+    sys.exit(1 if divergencias else 0)
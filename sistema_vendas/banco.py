@@ -0,0 +1,720 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from contextvars import copy_context
+from datetime import date
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+from decouple import config
+
+from sistema_vendas.cache_consultas import CacheConsultas, tabelas_lidas
+from sistema_vendas.esquemas import lote_arrow
+from sistema_vendas.fila_escrita import FilaEscrita
+from sistema_vendas.instrumentacao import Instrumentacao
+
+
+# Configuração inicial do banco de dados (pode ser trocado pela variável SISTEMA_VENDAS_DB)
+DB_NAME = config("SISTEMA_VENDAS_DB", default="sistema_vendas.db")
+
+# Parâmetros de conexão: várias conexões de leitura e uma única de escrita
+TAMANHO_POOL_LEITURA = 8
+BUSY_TIMEOUT_MS = 5000
+CACHE_SIZE_KB = 20000  # cache de páginas por conexão (~20 MB)
+MMAP_SIZE = 256 * 1024 * 1024  # 256 MB mapeados em memória
+STATEMENTS_EM_CACHE = 256  # comandos preparados mantidos por conexão
+CACHE_CONSULTAS_LINHAS = 500_000  # total de linhas de resultados mantidas em cache
+TAMANHO_LOTE_ARROW = 10_000  # linhas lidas por vez na leitura direta para Arrow
+# Threads para consultas independentes executadas ao mesmo tempo (0 ou 1 = em
+# sequência). O SQLite libera o GIL durante a consulta, mas o ganho depende de
+# núcleos livres: com um só núcleo as threads só acrescentam trocas de contexto.
+CONSULTAS_PARALELAS = min(
+    config("SISTEMA_VENDAS_CONSULTAS_PARALELAS", default=min(4, os.cpu_count() or 1), cast=int),
+    TAMANHO_POOL_LEITURA,
+)
+# Escritas aguardando a thread de gravação; com a fila cheia, quem grava espera
+# até ESPERA_FILA_ESCRITA_S segundos e então recebe FilaEscritaCheia
+TAMANHO_FILA_ESCRITA = config("SISTEMA_VENDAS_FILA_ESCRITA", default=1000, cast=int)
+ESPERA_FILA_ESCRITA_S = config("SISTEMA_VENDAS_ESPERA_FILA_ESCRITA_S", default=5, cast=float)
+
+# Colunas indexadas na busca textual (tabelas FTS5 <tabela>_fts)
+COLUNAS_BUSCA = {
+    "clientes": ("nome", "cpf", "email", "telefone", "endereco"),
+    "produtos": ("nome", "marca", "tamanho"),
+}
+
+
+class GerenciadorConexoes:
+    # Mantém um pool de conexões somente leitura e uma conexão de escrita
+    # compartilhadas por todas as sessões do processo.
+    def __init__(self, db_name, tamanho_pool=TAMANHO_POOL_LEITURA):
+        self.db_name = db_name
+        self._escrita = self._conectar()
+        # O modo WAL é persistente no arquivo e permite leituras durante a escrita
+        self._escrita.execute("PRAGMA journal_mode = WAL").close()
+        self._trava_escrita = threading.Lock()
+        self._versao_dados = self._ler_versao_dados()
+        self._leitura = queue.LifoQueue()
+        for _ in range(tamanho_pool):
+            self._leitura.put(self._conectar(somente_leitura=True))
+        self.cache = CacheConsultas(CACHE_CONSULTAS_LINHAS)
+        self.instrumentacao = Instrumentacao()
+        # Cada tarefa usa uma conexão do pool de leitura, então as consultas
+        # paralelas leem o banco ao mesmo tempo (WAL) sem dividir conexões
+        self.executor = (
+            ThreadPoolExecutor(CONSULTAS_PARALELAS, thread_name_prefix="consultas")
+            if CONSULTAS_PARALELAS > 1 else None
+        )
+        # Comandos avulsos das páginas gravados em segundo plano (veja fila_escrita)
+        self.fila_escrita = FilaEscrita(self, TAMANHO_FILA_ESCRITA, ESPERA_FILA_ESCRITA_S)
+
+    def _conectar(self, somente_leitura=False):
+        # isolation_level=None: as transações são controladas explicitamente em escrita()
+        conn = sqlite3.connect(
+            self.db_name,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=STATEMENTS_EM_CACHE,
+        )
+        pragmas = [
+            f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+            "PRAGMA synchronous = NORMAL",
+            f"PRAGMA cache_size = -{CACHE_SIZE_KB}",
+            f"PRAGMA mmap_size = {MMAP_SIZE}",
+            "PRAGMA temp_store = MEMORY",
+        ]
+        if somente_leitura:
+            pragmas.append("PRAGMA query_only = ON")
+        for pragma in pragmas:
+            # Fecha o cursor na hora para não deixar o PRAGMA pendente na conexão
+            conn.execute(pragma).close()
+        return conn
+
+    @contextmanager
+    def leitura(self):
+        conn = self._leitura.get()
+        try:
+            yield conn
+        finally:
+            self._leitura.put(conn)
+
+    @contextmanager
+    def escrita(self, *tabelas, esquema=False):
+        # Uma escrita por vez; BEGIN IMMEDIATE reserva o lock de escrita já no início.
+        # `tabelas` são as tabelas alteradas; sem elas todo o cache de consultas é
+        # descartado, exceto com `esquema=True` (só tabelas, índices, gatilhos e
+        # PRAGMAs, sem alterar dados), que não toca no cache.
+        with self._trava_escrita:
+            conn = self._escrita
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            self._conferir_versao_dados()
+        # Só depois do COMMIT, para nenhuma leitura antiga ser guardada com a versão nova
+        if not esquema:
+            self.cache.invalidar(tabelas)
+
+    # PRAGMA data_version da conexão de escrita muda quando outro processo
+    # (importação, gerador, reconstruir-*) grava no banco, mas não com os commits
+    # dela mesma; nesse caso nenhuma versão do cache vale mais e tudo é descartado
+    # (inclusive as cópias do motor analítico, que seguem as mesmas versões).
+    def _ler_versao_dados(self):
+        return self._escrita.execute("PRAGMA data_version").fetchone()[0]
+
+    def _conferir_versao_dados(self):
+        versao = self._ler_versao_dados()
+        if versao != self._versao_dados:
+            self._versao_dados = versao
+            self.cache.invalidar()
+
+    # Chamado antes de cada leitura com cache. Com uma escrita em andamento a
+    # conexão está ocupada e a conferência fica para o fim dela (em escrita()).
+    def verificar_escritas_externas(self):
+        if not self._trava_escrita.acquire(blocking=False):
+            return
+        try:
+            self._conferir_versao_dados()
+        finally:
+            self._trava_escrita.release()
+
+
+# Gerenciador único por processo, reaproveitado entre sessões e reruns. O banco
+# é criado e migrado uma única vez, junto com o gerenciador.
+@st.cache_resource(show_spinner=False)
+def get_db():
+    db = GerenciadorConexoes(DB_NAME)
+    _criar_esquema(db)
+    return db
+
+
+# Datas guardadas como texto ISO (AAAA-MM-DD), garantido pelo CHECK, para que a
+# ordem do texto seja a ordem cronológica e os intervalos usem os índices;
+# ano_mes (AAAA-MM) é derivado da data para os agrupamentos mensais
+_TABELA_PRODUTOS = """
+    CREATE TABLE IF NOT EXISTS {nome} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        nome TEXT NOT NULL,
+        marca TEXT,
+        tamanho TEXT,
+        preco_compra REAL NOT NULL,
+        preco_venda REAL NOT NULL,
+        data_compra DATE NOT NULL CHECK (data_compra IS date(data_compra)),
+        ano_mes TEXT GENERATED ALWAYS AS (substr(data_compra, 1, 7)) VIRTUAL
+    )
+"""
+_TABELA_MOVIMENTACOES = """
+    CREATE TABLE IF NOT EXISTS {nome} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        id_produto INTEGER NOT NULL,
+        tipo TEXT NOT NULL,
+        quantidade INTEGER NOT NULL,
+        profissional TEXT NOT NULL,
+        cliente TEXT,
+        data DATE NOT NULL CHECK (data IS date(data)),
+        ano_mes TEXT GENERATED ALWAYS AS (substr(data, 1, 7)) VIRTUAL,
+        FOREIGN KEY (id_produto) REFERENCES produtos (id)
+    )
+"""
+# Tabelas com datas normalizadas: (definição, coluna de data, demais colunas)
+_TABELAS_COM_DATA = {
+    "produtos": (_TABELA_PRODUTOS, "data_compra", ("id", "nome", "marca", "tamanho", "preco_compra", "preco_venda")),
+    "movimentacoes": (
+        _TABELA_MOVIMENTACOES, "data", ("id", "id_produto", "tipo", "quantidade", "profissional", "cliente")
+    ),
+}
+
+
+# Garante o banco criado e migrado (uma vez por processo; nos reruns seguintes só
+# devolve o gerenciador, sem travar a escrita nem descartar o cache)
+def init_db():
+    return get_db()
+
+
+# Reaplica o esquema, para quem removeu gatilhos ou índices de propósito (gerador)
+def atualizar_esquema():
+    _criar_esquema(get_db())
+
+
+# Tabelas, migrações, gatilhos e índices. As migrações só reescrevem dados de
+# bancos antigos, na criação do gerenciador, quando o cache ainda está vazio.
+def _criar_esquema(db):
+    with db.escrita(esquema=True) as conn:
+        cursor = conn.cursor()
+
+        # Tabelas do sistema, criação das tabela do banco de dados
+        cursor.execute(_TABELA_PRODUTOS.format(nome="produtos"))
+        cursor.execute(_TABELA_MOVIMENTACOES.format(nome="movimentacoes"))
+        cursor.execute("""
+        CREATE TABLE IF NOT EXISTS clientes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nome TEXT NOT NULL,
+            cpf TEXT NOT NULL,
+            endereco TEXT NOT NULL,
+            email TEXT NOT NULL,
+            telefone TEXT NOT NULL,
+            data_nascimento DATE NOT NULL,
+            data_cadastro DATE NOT NULL
+        )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS profissionais (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nome TEXT NOT NULL,
+                genero TEXT NOT NULL,
+                area_atuacao TEXT,
+                cpf TEXT NOT NULL UNIQUE,
+                telefone TEXT NOT NULL,
+                data_nascimento DATE,
+                endereco TEXT,
+                observacao TEXT,
+                data_cadastro DATE NOT NULL
+            )
+        """)
+        _migrar_profissionais(cursor)
+        _migrar_datas(cursor)
+
+        # Saldo em estoque por produto, mantido pelos gatilhos de movimentacoes
+        saldo_novo = not _existe(cursor, "table", "saldo_produtos")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS saldo_produtos (
+                id_produto INTEGER PRIMARY KEY,
+                saldo INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_saldo_movimentacao_insert
+            AFTER INSERT ON movimentacoes
+            BEGIN
+                INSERT INTO saldo_produtos (id_produto, saldo)
+                VALUES (NEW.id_produto, CASE NEW.tipo WHEN 'Compra' THEN NEW.quantidade
+                                                      WHEN 'Venda' THEN -NEW.quantidade ELSE 0 END)
+                ON CONFLICT (id_produto) DO UPDATE SET saldo = saldo + excluded.saldo;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_saldo_movimentacao_delete
+            AFTER DELETE ON movimentacoes
+            BEGIN
+                UPDATE saldo_produtos
+                SET saldo = saldo - CASE OLD.tipo WHEN 'Compra' THEN OLD.quantidade
+                                                  WHEN 'Venda' THEN -OLD.quantidade ELSE 0 END
+                WHERE id_produto = OLD.id_produto;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_saldo_movimentacao_update
+            AFTER UPDATE OF id_produto, tipo, quantidade ON movimentacoes
+            BEGIN
+                UPDATE saldo_produtos
+                SET saldo = saldo - CASE OLD.tipo WHEN 'Compra' THEN OLD.quantidade
+                                                  WHEN 'Venda' THEN -OLD.quantidade ELSE 0 END
+                WHERE id_produto = OLD.id_produto;
+                INSERT INTO saldo_produtos (id_produto, saldo)
+                VALUES (NEW.id_produto, CASE NEW.tipo WHEN 'Compra' THEN NEW.quantidade
+                                                      WHEN 'Venda' THEN -NEW.quantidade ELSE 0 END)
+                ON CONFLICT (id_produto) DO UPDATE SET saldo = saldo + excluded.saldo;
+            END
+        """)
+        if saldo_novo:
+            _reconstruir_saldos(cursor)
+
+        # Total de movimentações (uma linha), mantido pelos gatilhos: o histórico
+        # sem filtros mostra o total sem contar a maior tabela a cada escrita
+        contagem_nova = not _existe(cursor, "table", "contagem_movimentacoes")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS contagem_movimentacoes (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total INTEGER NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_contagem_movimentacao_insert
+            AFTER INSERT ON movimentacoes
+            BEGIN
+                UPDATE contagem_movimentacoes SET total = total + 1 WHERE id = 1;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_contagem_movimentacao_delete
+            AFTER DELETE ON movimentacoes
+            BEGIN
+                UPDATE contagem_movimentacoes SET total = total - 1 WHERE id = 1;
+            END
+        """)
+        if contagem_nova:
+            _reconstruir_contagem(cursor)
+
+        # Resumo diário por produto e tipo usado pelo dashboard, mantido pelos gatilhos
+        # abaixo; o faturamento acompanha o preço de venda atual do produto
+        vendas_diarias_nova = not _existe(cursor, "table", "vendas_diarias")
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS vendas_diarias (
+                tipo TEXT NOT NULL,
+                dia TEXT NOT NULL,
+                id_produto INTEGER NOT NULL,
+                quantidade INTEGER NOT NULL DEFAULT 0,
+                faturamento REAL NOT NULL DEFAULT 0,
+                ano_mes TEXT GENERATED ALWAYS AS (substr(dia, 1, 7)) VIRTUAL,
+                PRIMARY KEY (tipo, dia, id_produto)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vendas_diarias_produto
+            ON vendas_diarias (id_produto)
+        """)
+        # Agrupamento mensal do dashboard percorrendo o índice já na ordem dos meses
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vendas_diarias_ano_mes
+            ON vendas_diarias (tipo, ano_mes, dia, quantidade, faturamento)
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_vendas_diarias_insert
+            AFTER INSERT ON movimentacoes
+            BEGIN
+                {_somar_vendas_diarias("NEW", "+")}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_vendas_diarias_delete
+            AFTER DELETE ON movimentacoes
+            BEGIN
+                {_somar_vendas_diarias("OLD", "-")}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_vendas_diarias_update
+            AFTER UPDATE OF id_produto, tipo, quantidade, data ON movimentacoes
+            BEGIN
+                {_somar_vendas_diarias("OLD", "-")}
+                {_somar_vendas_diarias("NEW", "+")}
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_vendas_diarias_preco
+            AFTER UPDATE OF preco_venda ON produtos
+            BEGIN
+                UPDATE vendas_diarias
+                SET faturamento = quantidade * NEW.preco_venda
+                WHERE id_produto = NEW.id AND tipo = 'Venda';
+            END
+        """)
+        if vendas_diarias_nova:
+            _reconstruir_vendas_diarias(cursor)
+
+        # Índices de busca textual com conteúdo externo: o texto fica só na tabela
+        # original e os gatilhos mantêm o índice invertido em dia
+        for tabela, colunas in COLUNAS_BUSCA.items():
+            fts = f"{tabela}_fts"
+            fts_nova = not _existe(cursor, "table", fts)
+            lista = ", ".join(colunas)
+            novos = ", ".join(f"NEW.{coluna}" for coluna in colunas)
+            antigos = ", ".join(f"OLD.{coluna}" for coluna in colunas)
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                    {lista},
+                    content='{tabela}', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{fts}_insert
+                AFTER INSERT ON {tabela}
+                BEGIN
+                    INSERT INTO {fts} (rowid, {lista}) VALUES (NEW.id, {novos});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{fts}_delete
+                AFTER DELETE ON {tabela}
+                BEGIN
+                    INSERT INTO {fts} ({fts}, rowid, {lista}) VALUES ('delete', OLD.id, {antigos});
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{fts}_update
+                AFTER UPDATE OF {lista} ON {tabela}
+                BEGIN
+                    INSERT INTO {fts} ({fts}, rowid, {lista}) VALUES ('delete', OLD.id, {antigos});
+                    INSERT INTO {fts} (rowid, {lista}) VALUES (NEW.id, {novos});
+                END
+            """)
+            if fts_nova:
+                cursor.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+        # Índices para os filtros e junções mais usados no dashboard e no estoque
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_movimentacoes_tipo_data
+            ON movimentacoes (tipo, data, id_produto, quantidade)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_movimentacoes_produto_tipo
+            ON movimentacoes (id_produto, tipo, quantidade)
+        """)
+        # Mantém as movimentações de um produto em ordem de id para o histórico paginado
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_movimentacoes_produto
+            ON movimentacoes (id_produto)
+        """)
+        # Idem para o filtro por tipo: o rowid implícito no fim do índice atende
+        # `tipo = ? AND id < ? ORDER BY id DESC` sem ordenar todas as linhas do tipo
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_movimentacoes_tipo
+            ON movimentacoes (tipo)
+        """)
+        # Filtro por período do histórico (e sua contagem)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_movimentacoes_data
+            ON movimentacoes (data)
+        """)
+        # Filtro por início do nome do profissional (LIKE 'prefixo%', sem diferenciar
+        # maiúsculas, como os índices de nome dos cadastros)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_movimentacoes_profissional
+            ON movimentacoes (profissional COLLATE NOCASE, id)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_produtos_ano_mes
+            ON produtos (ano_mes, data_compra, preco_compra)
+        """)
+        # Busca por início do nome nos seletores do formulário de movimentações
+        for tabela in ("produtos", "clientes", "profissionais"):
+            cursor.execute(f"""
+                CREATE INDEX IF NOT EXISTS idx_{tabela}_nome
+                ON {tabela} (nome COLLATE NOCASE)
+            """)
+        # Atualiza as estatísticas do planejador quando necessário
+        cursor.execute("PRAGMA optimize")
+
+
+def _existe(cursor, tipo, nome):
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = ? AND name = ?", (tipo, nome))
+    return cursor.fetchone() is not None
+
+
+def _tem_coluna(cursor, tabela, coluna):
+    # table_xinfo inclui as colunas geradas
+    cursor.execute(f"PRAGMA table_xinfo({tabela})")
+    return any(linha[1] == coluna for linha in cursor.fetchall())
+
+
+# Colunas de profissionais que não existiam nos bancos criados pelos scripts
+# antigos (app.py/appy.py), com o valor usado nas linhas já cadastradas
+_COLUNAS_PROFISSIONAIS = {
+    "genero": "TEXT NOT NULL DEFAULT ''",
+    "telefone": "TEXT NOT NULL DEFAULT ''",
+    "data_cadastro": "DATE NOT NULL DEFAULT '{hoje}'",
+}
+
+
+# Leva a tabela profissionais de um banco antigo ao esquema único; a data de
+# cadastro das linhas existentes passa a ser a data da migração
+def _migrar_profissionais(cursor):
+    for coluna, definicao in _COLUNAS_PROFISSIONAIS.items():
+        if not _tem_coluna(cursor, "profissionais", coluna):
+            definicao = definicao.format(hoje=date.today().isoformat())
+            cursor.execute(f"ALTER TABLE profissionais ADD COLUMN {coluna} {definicao}")
+
+
+# Data em ISO a partir de ISO (com ou sem hora) ou DD/MM/AAAA; NULL se não reconhecida
+def _data_iso(coluna):
+    return f"""COALESCE(date({coluna}), CASE WHEN {coluna} GLOB '[0-9][0-9]/[0-9][0-9]/[0-9][0-9][0-9][0-9]'
+        THEN date(substr({coluna}, 7, 4) || '-' || substr({coluna}, 4, 2) || '-' || substr({coluna}, 1, 2)) END)"""
+
+
+# Migra bancos anteriores ao CHECK de datas e à coluna ano_mes: recria as tabelas
+# com as datas normalizadas (SQLite não acrescenta CHECK a uma tabela existente).
+# Os gatilhos são removidos e recriados em seguida, no restante de
+# _criar_esquema(); vendas_diarias é refeita a partir das movimentações já normalizadas.
+def _migrar_datas(cursor):
+    pendentes = [tabela for tabela in _TABELAS_COM_DATA if not _tem_coluna(cursor, tabela, "ano_mes")]
+    if not pendentes:
+        return
+    for tabela in pendentes:
+        _, coluna_data, _ = _TABELAS_COM_DATA[tabela]
+        cursor.execute(f"SELECT id, {coluna_data} FROM {tabela} WHERE {_data_iso(coluna_data)} IS NULL LIMIT 10")
+        invalidas = cursor.fetchall()
+        if invalidas:
+            raise ValueError(f"Datas não reconhecidas em {tabela}.{coluna_data} (id, valor): {invalidas}")
+
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    for (gatilho,) in cursor.fetchall():
+        cursor.execute(f"DROP TRIGGER {gatilho}")
+    cursor.execute("DROP TABLE IF EXISTS vendas_diarias")
+
+    for tabela in pendentes:
+        definicao, coluna_data, colunas = _TABELAS_COM_DATA[tabela]
+        lista = ", ".join(colunas)
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (tabela,))
+        sequencia = cursor.fetchone()
+        cursor.execute(definicao.format(nome=f"{tabela}_migracao"))
+        cursor.execute(f"""
+            INSERT INTO {tabela}_migracao ({lista}, {coluna_data})
+            SELECT {lista}, {_data_iso(coluna_data)} FROM {tabela}
+        """)
+        cursor.execute(f"DROP TABLE {tabela}")
+        cursor.execute(f"ALTER TABLE {tabela}_migracao RENAME TO {tabela}")
+        if sequencia:
+            # Preserva o próximo id mesmo que os últimos registros tenham sido apagados
+            cursor.execute("DELETE FROM sqlite_sequence WHERE name = ?", (tabela,))
+            cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (tabela, sequencia[0]))
+
+
+def _reconstruir_saldos(cursor):
+    cursor.execute("DELETE FROM saldo_produtos")
+    cursor.execute("""
+        INSERT INTO saldo_produtos (id_produto, saldo)
+        SELECT id_produto,
+               SUM(CASE tipo WHEN 'Compra' THEN quantidade WHEN 'Venda' THEN -quantidade ELSE 0 END)
+        FROM movimentacoes
+        GROUP BY id_produto
+    """)
+
+
+def _reconstruir_contagem(cursor):
+    cursor.execute("INSERT OR REPLACE INTO contagem_movimentacoes (id, total) SELECT 1, COUNT(*) FROM movimentacoes")
+
+
+# Corpo dos gatilhos de vendas_diarias: soma (+) ou subtrai (-) a movimentação
+# NEW/OLD da linha do dia, recalculando o faturamento pelo preço atual
+def _somar_vendas_diarias(linha, sinal):
+    preco = f"COALESCE((SELECT preco_venda FROM produtos WHERE id = {linha}.id_produto), 0)"
+    return f"""
+                INSERT INTO vendas_diarias (tipo, dia, id_produto, quantidade, faturamento)
+                VALUES ({linha}.tipo, {linha}.data, {linha}.id_produto,
+                        {sinal}{linha}.quantidade,
+                        CASE WHEN {linha}.tipo = 'Venda' THEN {sinal}{linha}.quantidade * {preco} ELSE 0 END)
+                ON CONFLICT (tipo, dia, id_produto) DO UPDATE SET
+                    quantidade = quantidade + excluded.quantidade,
+                    faturamento = CASE WHEN tipo = 'Venda'
+                                       THEN (quantidade + excluded.quantidade) * {preco} ELSE 0 END;"""
+
+
+def _reconstruir_vendas_diarias(cursor):
+    cursor.execute("DELETE FROM vendas_diarias")
+    cursor.execute("""
+        INSERT INTO vendas_diarias (tipo, dia, id_produto, quantidade, faturamento)
+        SELECT m.tipo, m.data AS dia, m.id_produto, SUM(m.quantidade),
+               CASE WHEN m.tipo = 'Venda' THEN SUM(m.quantidade) * COALESCE(p.preco_venda, 0) ELSE 0 END
+        FROM movimentacoes m
+        LEFT JOIN produtos p ON p.id = m.id_produto
+        GROUP BY m.tipo, dia, m.id_produto
+    """)
+
+
+# Recalcula todos os saldos e o total de movimentações a partir do histórico
+# (reconciliação manual)
+def reconstruir_saldos():
+    with get_db().escrita("saldo_produtos", "contagem_movimentacoes") as conn:
+        _reconstruir_saldos(conn.cursor())
+        _reconstruir_contagem(conn.cursor())
+
+
+# Recalcula o resumo diário de vendas a partir do histórico
+def reconstruir_vendas_diarias():
+    with get_db().escrita("vendas_diarias") as conn:
+        _reconstruir_vendas_diarias(conn.cursor())
+
+
+# Recria os índices de busca textual a partir de clientes e produtos
+def reconstruir_busca():
+    tabelas = [f"{tabela}_fts" for tabela in COLUNAS_BUSCA]
+    with get_db().escrita(*tabelas) as conn:
+        for fts in tabelas:
+            conn.execute(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+
+# Leitura com cache: devolve (colunas, linhas), reaproveitando o resultado enquanto
+# nenhuma das tabelas consultadas for alterada
+def _consultar(query, params=None):
+    db = get_db()
+    db.verificar_escritas_externas()
+    tabelas = tabelas_lidas(query)
+    chave = db.cache.chave(query, params, tabelas) if tabelas else None
+    if chave is not None:
+        resultado = db.cache.obter(chave)
+        if resultado is not None:
+            return resultado
+    with db.leitura() as conn:
+        inicio = time.perf_counter()
+        cursor = conn.execute(query, params or ())
+        linhas = cursor.fetchall()
+        colunas = [descricao[0] for descricao in cursor.description or ()]
+        db.instrumentacao.registrar(query, time.perf_counter() - inicio, len(linhas), conn, params)
+    resultado = (colunas, linhas)
+    if chave is not None:
+        db.cache.guardar(chave, resultado)
+    return resultado
+
+
+def _cronometrar(funcao, args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+# Executa consultas independentes ao mesmo tempo e devolve (nome, resultado,
+# segundos) na ordem em que terminam. `tarefas` é {nome: (função, argumentos)}.
+# Cada tarefa roda numa cópia do contexto atual, para a instrumentação saber a
+# página; sem threads configuradas, as tarefas rodam em sequência nesta thread.
+def consultar_em_paralelo(tarefas):
+    executor = get_db().executor
+    if executor is None:
+        for nome, (funcao, args) in tarefas.items():
+            yield (nome, *_cronometrar(funcao, args))
+        return
+    futuros = {
+        executor.submit(copy_context().run, _cronometrar, funcao, args): nome
+        for nome, (funcao, args) in tarefas.items()
+    }
+    for futuro in as_completed(futuros):
+        yield (futuros[futuro], *futuro.result())
+
+
+# Envia um comando de escrita (ou, com `em_lote`, um executemany) para a fila de
+# gravação e devolve um Future com o número de linhas alteradas ou o erro do comando
+def enviar_escrita(query, params=None, em_lote=False):
+    return get_db().fila_escrita.enviar(query, params, em_lote)
+
+
+# Função genérica para executar comandos no banco de dados. Escritas passam pela
+# fila de gravação; a espera pelo resultado devolve o erro a quem chamou e
+# garante que o próximo rerun já leia o dado gravado.
+def execute_query(query, params=None, fetch=False):
+    if fetch:
+        # Cópia da lista para que quem chamou não altere o resultado em cache
+        return list(_consultar(query, params)[1])
+    return enviar_escrita(query, params).result()
+
+
+# Leitura direta para uma tabela Arrow, que st.dataframe exibe sem passar pelo
+# pandas: o cursor é lido em lotes e cada lote vira colunas tipadas pelo
+# `esquema` (um campo por coluna do SELECT), sem a lista com todas as linhas
+# nem o DataFrame intermediário. O resultado vai para o cache de consultas,
+# exceto com `em_cache=False` (cópias inteiras de tabelas, guardadas por quem leu).
+def consultar_arrow(query, esquema, params=None, tamanho_lote=TAMANHO_LOTE_ARROW, em_cache=True):
+    db = get_db()
+    db.verificar_escritas_externas()
+    tabelas = tabelas_lidas(query) if em_cache else ()
+    chave = (*db.cache.chave(query, params, tabelas), esquema) if tabelas else None
+    if chave is not None:
+        resultado = db.cache.obter(chave)
+        if resultado is not None:
+            return resultado[1]
+    with db.leitura() as conn:
+        inicio = time.perf_counter()
+        cursor = conn.execute(query, params or ())
+        try:
+            lotes = []
+            while linhas := cursor.fetchmany(tamanho_lote):
+                lotes.append(lote_arrow(linhas, esquema))
+        finally:
+            cursor.close()
+        tabela = pa.Table.from_batches(lotes, schema=esquema)
+        db.instrumentacao.registrar(query, time.perf_counter() - inicio, tabela.num_rows, conn, params)
+    if chave is not None:
+        # O cache mede o tamanho pelo número de linhas do segundo item
+        db.cache.guardar(chave, (esquema.names, tabela))
+    return tabela
+
+
+# DataFrame a partir de uma consulta de leitura (usado pelas planilhas editáveis)
+def read_dataframe(query, params=None):
+    colunas, linhas = _consultar(query, params)
+    return pd.DataFrame(linhas, columns=colunas)
+
+
+def tabela_existe(nome):
+    return bool(execute_query(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (nome,), fetch=True
+    ))
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Manutenção do banco de dados do sistema de vendas")
+    parser.add_argument("comando", choices=["reconstruir-saldos", "reconstruir-vendas-diarias", "reconstruir-busca"])
+    args = parser.parse_args()
+
+    init_db()
+    if args.comando == "reconstruir-saldos":
+        reconstruir_saldos()
+        total = execute_query("SELECT COUNT(*) FROM saldo_produtos", fetch=True)[0][0]
+        print(f"Saldos reconstruídos para {total} produtos.")
+    elif args.comando == "reconstruir-vendas-diarias":
+        reconstruir_vendas_diarias()
+        total = execute_query("SELECT COUNT(*) FROM vendas_diarias", fetch=True)[0][0]
+        print(f"Resumo diário reconstruído com {total} linhas.")
+    elif args.comando == "reconstruir-busca":
+        reconstruir_busca()
+        print("Índices de busca reconstruídos.")
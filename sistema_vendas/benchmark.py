@@ -0,0 +1,259 @@
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pyarrow as pa
+import streamlit
+from streamlit.testing.v1 import AppTest
+from streamlit.util import calc_md5
+
+from sistema_vendas.analitico import MOTOR_ANALITICO
+from sistema_vendas.banco import DB_NAME, execute_query, get_db, init_db
+from sistema_vendas.paginas import enderecos_paginas
+
+
+SCRIPT = Path(__file__).resolve().parent.parent / "system_sales_streamlit.py"
+RERUNS = 5
+TIMEOUT_S = 600
+TABELAS_CONTADAS = ("produtos", "clientes", "profissionais", "movimentacoes")
+
+PARTIDAS = 5
+# Módulos pesados que só deveriam ser carregados pelas páginas que os usam
+MODULOS_PESADOS = ("plotly.express", "st_aggrid", "webbrowser")
+
+# Métricas comparadas com a linha de base (menor é melhor)
+METRICAS = ("frio_ms", "quente_ms", "consultas_ms", "pico_memoria_mb")
+METRICAS_PARTIDA = ("login_frio_ms", "login_quente_ms", "primeira_pagina_ms")
+
+# Executado em um interpretador novo: primeira execução da tela de login (com as
+# importações do script), um rerun dela e a primeira página após o login
+_CODIGO_PARTIDA = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+from streamlit.util import calc_md5
+app = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[2]))
+inicio = time.perf_counter(); app.run(); login_frio = time.perf_counter() - inicio
+inicio = time.perf_counter(); app.run(); login_quente = time.perf_counter() - inicio
+modulos_login = [nome for nome in sys.argv[3:] if nome in sys.modules]
+app.session_state["logado"] = True
+inicio = time.perf_counter(); app.run(); primeira_pagina = time.perf_counter() - inicio
+print(json.dumps({
+    "login_frio_ms": login_frio * 1000, "login_quente_ms": login_quente * 1000,
+    "primeira_pagina_ms": primeira_pagina * 1000, "modulos_no_login": modulos_login,
+}))
+"""
+
+
+# Conta os comandos executados no banco e o tempo gasto neles enquanto o bloco
+# executa, pelo mesmo registro da instrumentação: entram as leituras de
+# execute_query/read_dataframe, as do Arrow e as do DuckDB (acertos de cache não
+# chegam ao banco e não contam)
+@contextmanager
+def _medir_consultas():
+    medicao = {"consultas": 0, "segundos": 0.0}
+    instrumentacao = get_db().instrumentacao
+    original = instrumentacao.registrar
+    trava = threading.Lock()
+
+    def contar(query, segundos, linhas, conn=None, params=None):
+        with trava:
+            medicao["consultas"] += 1
+            medicao["segundos"] += segundos
+        return original(query, segundos, linhas, conn, params)
+
+    instrumentacao.registrar = contar
+    try:
+        yield medicao
+    finally:
+        del instrumentacao.registrar
+
+
+# Maior total alocado no pool de memória do Arrow enquanto o bloco executa,
+# acima do que já estava alocado antes, amostrado a cada `intervalo_s` segundos
+@contextmanager
+def _medir_arrow(intervalo_s=0.001):
+    antes = pa.total_allocated_bytes()
+    medicao = {"pico": 0}
+    fim = threading.Event()
+
+    def amostrar():
+        while True:
+            medicao["pico"] = max(medicao["pico"], pa.total_allocated_bytes() - antes)
+            if fim.wait(intervalo_s):
+                break
+
+    amostrador = threading.Thread(target=amostrar, name="benchmark-arrow", daemon=True)
+    amostrador.start()
+    try:
+        yield medicao
+    finally:
+        fim.set()
+        amostrador.join()
+        medicao["pico"] = max(medicao["pico"], pa.total_allocated_bytes() - antes)
+
+
+def _app_logado(timeout):
+    app = AppTest.from_file(str(SCRIPT), default_timeout=timeout)
+    app.run()  # tela de login: cria/migra o banco
+    app.session_state["logado"] = True
+    app.run()
+    return app
+
+
+# Seleciona a página aberta no próximo app.run() de um AppTest. O
+# AppTest.switch_page só abre páginas em arquivo e não há API pública para as
+# páginas do st.navigation, que o Streamlit identifica pelo hash do endereço na
+# URL: o atributo interno do AppTest fica restrito a esta função.
+def abrir_pagina(app, pagina):
+    app._page_hash = calc_md5(enderecos_paginas()[pagina])
+
+
+def _executar(app, frio):
+    if frio:
+        get_db().cache.invalidar()
+    inicio = time.perf_counter()
+    app.run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+    return (time.perf_counter() - inicio) * 1000
+
+
+# Tempo do primeiro rerun com o cache de consultas vazio (frio), mediana dos
+# reruns seguintes (quente), tempo e número de consultas no rerun frio e pico
+# de memória em um rerun frio medido à parte: o alocado pelo Python (tracemalloc
+# deixa o código mais lento, por isso não entra na medição de tempo) mais o que
+# o pico do pool de memória do Arrow, que o tracemalloc não enxerga
+def medir_pagina(pagina, reruns=RERUNS, timeout=TIMEOUT_S):
+    app = _app_logado(timeout)
+    abrir_pagina(app, pagina)
+    with _medir_consultas() as consultas:
+        frio_ms = _executar(app, frio=True)
+    quente_ms = [_executar(app, frio=False) for _ in range(reruns)]
+
+    get_db().cache.invalidar()
+    tracemalloc.start()
+    try:
+        with _medir_arrow() as arrow:
+            _executar(app, frio=True)
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "frio_ms": round(frio_ms, 1),
+        "quente_ms": round(statistics.median(quente_ms), 1),
+        "consultas": consultas["consultas"],
+        "consultas_ms": round(consultas["segundos"] * 1000, 1),
+        "pico_memoria_mb": round((pico + arrow["pico"]) / 2**20, 1),
+        "pico_arrow_mb": round(arrow["pico"] / 2**20, 1),
+    }
+
+
+# Partida a frio: cada medição roda em um processo Python novo, sem módulos em
+# memória, e informa quais módulos pesados já estavam carregados na tela de login
+def medir_partida(partidas=PARTIDAS, timeout=TIMEOUT_S):
+    medicoes = []
+    for _ in range(partidas):
+        processo = subprocess.run(
+            [sys.executable, "-c", _CODIGO_PARTIDA, str(SCRIPT), str(timeout), *MODULOS_PESADOS],
+            cwd=SCRIPT.parent, capture_output=True, text=True, check=True,
+        )
+        medicoes.append(json.loads(processo.stdout.strip().splitlines()[-1]))
+    resultado = {
+        metrica: round(statistics.median(medicao[metrica] for medicao in medicoes), 1)
+        for metrica in METRICAS_PARTIDA
+    }
+    resultado["modulos_no_login"] = medicoes[-1]["modulos_no_login"]
+    return resultado
+
+
+# Versão do código gravada junto dos resultados (git describe; None fora de um repositório)
+def versao_codigo():
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], cwd=SCRIPT.parent, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar_benchmark(paginas=None, reruns=RERUNS, timeout=TIMEOUT_S, partidas=PARTIDAS):
+    init_db()
+    print("Partida a frio...", end=" ", flush=True)
+    partida = medir_partida(partidas, timeout) if partidas else {}
+    print(partida)
+    if paginas is None:
+        paginas = list(enderecos_paginas())
+    resultados = {}
+    for pagina in paginas:
+        print(f"{pagina}...", end=" ", flush=True)
+        try:
+            resultados[pagina] = medir_pagina(pagina, reruns, timeout)
+        except Exception as e:
+            resultados[pagina] = {"erro": str(e)}
+        print(resultados[pagina])
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "versao": versao_codigo(),
+        "banco": str(DB_NAME),
+        "linhas": {
+            tabela: execute_query(f"SELECT COUNT(*) FROM {tabela}", fetch=True)[0][0] for tabela in TABELAS_CONTADAS
+        },
+        "ambiente": {
+            "python": platform.python_version(),
+            "streamlit": streamlit.__version__,
+            "sqlite": sqlite3.sqlite_version,
+            "motor_analitico": MOTOR_ANALITICO,
+        },
+        "reruns": reruns,
+        "partida": partida,
+        "paginas": resultados,
+    }
+
+
+# Variação de cada métrica em relação à linha de base, página a página
+def comparar(base, atual):
+    linhas = []
+    for metrica in METRICAS_PARTIDA:
+        if metrica in atual.get("partida", {}) and metrica in base.get("partida", {}):
+            antes, depois = base["partida"][metrica], atual["partida"][metrica]
+            linhas.append(("(partida)", metrica, antes, depois, (depois - antes) / antes * 100 if antes else 0.0))
+    for pagina, medidas in atual["paginas"].items():
+        anteriores = base["paginas"].get(pagina, {})
+        for metrica in METRICAS:
+            if metrica in medidas and metrica in anteriores:
+                antes, depois = anteriores[metrica], medidas[metrica]
+                variacao = (depois - antes) / antes * 100 if antes else 0.0
+                linhas.append((pagina, metrica, antes, depois, variacao))
+    return linhas
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark das páginas do sistema com reruns headless (AppTest)")
+    parser.add_argument("--saida", default="benchmark.json", help="arquivo JSON com os resultados")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior usado como linha de base")
+    parser.add_argument("--paginas", nargs="+", help="páginas medidas (padrão: todas)")
+    parser.add_argument("--reruns", type=int, default=RERUNS, help="reruns quentes por página")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_S, help="limite em segundos por rerun")
+    parser.add_argument("--partidas", type=int, default=PARTIDAS, help="processos novos na medição de partida (0 = pula)")
+    args = parser.parse_args()
+
+    resultado = executar_benchmark(args.paginas, args.reruns, args.timeout, args.partidas)
+    Path(args.saida).write_text(json.dumps(resultado, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Resultados gravados em {args.saida}.")
+
+    if args.comparar:
+        base = json.loads(Path(args.comparar).read_text(encoding="utf-8"))
+        print(f"\nComparação com {args.comparar} ({base.get('versao')}):")
+        for pagina, metrica, antes, depois, variacao in comparar(base, resultado):
+            print(f"{pagina:<28} {metrica:<16} {antes:>10} -> {depois:>10} ({variacao:+.1f}%)")
@@ -0,0 +1,66 @@
+import re
+
+import pandas as pd
+
+from sistema_vendas.banco import COLUNAS_BUSCA, execute_query
+
+
+LIMITE_RESULTADOS = 20
+
+# Pesos do bm25 por coluna, na ordem de COLUNAS_BUSCA: o nome pesa mais
+PESOS_BUSCA = {
+    "clientes": (10.0, 5.0, 3.0, 3.0, 1.0),
+    "produtos": (10.0, 4.0, 2.0),
+}
+
+# Texto exibido em cada resultado: (título, detalhe)
+_EXIBICAO = {
+    "clientes": ("t.nome", "t.cpf || ' · ' || t.email || ' · ' || t.telefone"),
+    "produtos": ("t.nome", "COALESCE(t.marca, '') || ' · ' || COALESCE(t.tamanho, '')"),
+}
+
+
+# Converte o texto digitado em uma expressão MATCH segura: cada palavra vira
+# um prefixo entre aspas ("joa"* "sil"*), todas obrigatórias.
+# Devolve None quando não há palavras para buscar.
+def expressao_busca(texto):
+    palavras = re.findall(r"\w+", texto or "")
+    if not palavras:
+        return None
+    return " ".join(f'"{palavra}"*' for palavra in palavras)
+
+
+# Ids da tabela cujo texto casa com a busca, para usar em `id IN (...)`
+def condicao_busca(tabela):
+    return f"id IN (SELECT rowid FROM {tabela}_fts WHERE {tabela}_fts MATCH ?)"
+
+
+# Melhores resultados de uma tabela, do mais para o menos relevante
+def buscar_na_tabela(tabela, texto, limite=LIMITE_RESULTADOS):
+    expressao = expressao_busca(texto)
+    if expressao is None:
+        return []
+    titulo, detalhe = _EXIBICAO[tabela]
+    pesos = ", ".join(str(peso) for peso in PESOS_BUSCA[tabela])
+    return execute_query(f"""
+        SELECT t.id, {titulo}, {detalhe}, bm25({tabela}_fts, {pesos}) AS relevancia
+        FROM {tabela}_fts
+        JOIN {tabela} t ON t.id = {tabela}_fts.rowid
+        WHERE {tabela}_fts MATCH ?
+        ORDER BY relevancia
+        LIMIT ?
+    """, (expressao, limite), fetch=True)
+
+
+# Busca global em clientes e produtos; resultados combinados pela relevância
+# (bm25 é negativo: quanto menor, mais relevante)
+def buscar(texto, limite=LIMITE_RESULTADOS):
+    linhas = [
+        (tabela.capitalize(), *linha)
+        for tabela in COLUNAS_BUSCA
+        for linha in buscar_na_tabela(tabela, texto, limite)
+    ]
+    linhas.sort(key=lambda linha: linha[-1])
+    resultado = pd.DataFrame(linhas[:limite], columns=["Tipo", "ID", "Nome", "Detalhes", "Relevância"])
+    resultado["Relevância"] = -resultado["Relevância"]
+    return resultado
@@ -0,0 +1,113 @@
+import re
+import threading
+from collections import Counter
+from functools import lru_cache
+
+from cachetools import LRUCache
+
+
+# Tabelas cujas leituras podem ser guardadas em cache
+TABELAS = (
+    "produtos", "movimentacoes", "clientes", "profissionais",
+    "saldo_produtos", "vendas_diarias", "contagem_movimentacoes", "clientes_fts", "produtos_fts",
+)
+
+# Tabelas alteradas pelos gatilhos quando a tabela de origem é escrita
+TABELAS_DERIVADAS = {
+    "movimentacoes": ("saldo_produtos", "vendas_diarias", "contagem_movimentacoes"),
+    "produtos": ("vendas_diarias", "produtos_fts"),
+    "clientes": ("clientes_fts",),
+}
+
+_PADRAO_TABELAS = re.compile(r"\b(" + "|".join(TABELAS) + r")\b", re.IGNORECASE)
+_PADRAO_ESCRITA = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)\s+[`\"]?(\w+)",
+    re.IGNORECASE,
+)
+
+
+# Tabelas conhecidas citadas em uma consulta de leitura
+@lru_cache(maxsize=1024)
+def tabelas_lidas(query):
+    return tuple(sorted({nome.lower() for nome in _PADRAO_TABELAS.findall(query)}))
+
+
+# Tabela alterada por um comando de escrita (None quando não é possível identificar)
+@lru_cache(maxsize=1024)
+def tabela_escrita(query):
+    encontrado = _PADRAO_ESCRITA.match(query)
+    return encontrado.group(1).lower() if encontrado else None
+
+
+def _congelar(params):
+    if not params:
+        return ()
+    if isinstance(params, dict):
+        return tuple(sorted(params.items()))
+    return tuple(params)
+
+
+class CacheConsultas:
+    # Resultados de leitura indexados por SQL + parâmetros + versão das tabelas lidas.
+    # Cada escrita incrementa a versão das tabelas afetadas, tornando as entradas
+    # antigas inalcançáveis; o LRU limita o total de linhas mantidas em memória.
+    def __init__(self, max_linhas):
+        self._dados = LRUCache(maxsize=max_linhas, getsizeof=lambda resultado: max(len(resultado[1]), 1))
+        self._versoes = Counter()
+        self._geracao = 0
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def chave(self, query, params, tabelas):
+        with self._trava:
+            versoes = tuple(self._versoes[tabela] for tabela in tabelas)
+            return (self._geracao, query, _congelar(params), versoes)
+
+    # Versão de uma tabela: muda a cada escrita nela (ou em uma tabela de origem)
+    # e a cada invalidação total
+    def versao(self, tabela):
+        with self._trava:
+            return (self._geracao, self._versoes[tabela])
+
+    def obter(self, chave):
+        with self._trava:
+            resultado = self._dados.get(chave)
+            if resultado is None:
+                self.falhas += 1
+            else:
+                self.acertos += 1
+            return resultado
+
+    def guardar(self, chave, resultado):
+        with self._trava:
+            try:
+                self._dados[chave] = resultado
+            except ValueError:
+                # Resultado maior que o cache inteiro: não é guardado
+                pass
+
+    def invalidar(self, tabelas=None):
+        with self._trava:
+            if not tabelas:
+                # Escrita sem tabela conhecida: descarta tudo
+                self._geracao += 1
+                self._dados.clear()
+                return
+            for tabela in tabelas:
+                self._versoes[tabela] += 1
+                for derivada in TABELAS_DERIVADAS.get(tabela, ()):
+                    self._versoes[derivada] += 1
+
+    def estatisticas(self):
+        with self._trava:
+            total = self.acertos + self.falhas
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+                "entradas": len(self._dados),
+                "linhas": self._dados.currsize,
+                "max_linhas": self._dados.maxsize,
+                "versoes": {tabela: self._versoes[tabela] for tabela in TABELAS},
+            }
@@ -0,0 +1,285 @@
+import asyncio
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+import urllib.request
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from streamlit.proto.Alert_pb2 import Alert
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.util import calc_md5
+from tornado.websocket import websocket_connect
+
+from sistema_vendas.benchmark import SCRIPT, versao_codigo
+from sistema_vendas.paginas import enderecos_paginas
+
+
+PORTA = 8599
+SESSOES = 8
+DURACAO_S = 60
+PAUSA_S = 1.0  # pausa máxima entre as ações de uma sessão (tempo do caixa)
+TIMEOUT_S = 120
+# Ações sorteadas por cada sessão e seus pesos
+MISTURA = {"movimentacao": 4, "estoque": 3, "dashboard": 2}
+# Produtos buscados pelo id (1..N) ao registrar movimentações
+PRODUTOS = 50
+
+# Mensagens de erro causadas por disputa pela escrita no banco
+_PADRAO_BLOQUEIO = re.compile(r"locked|busy|Fila de escrita cheia", re.IGNORECASE)
+_PERCENTIS = (50, 95, 99)
+
+
+# Cliente mínimo do protocolo do Streamlit (o mesmo websocket do navegador):
+# envia os reruns com o estado dos widgets e lê as mensagens até o fim da execução
+class Sessao:
+    def __init__(self, ws):
+        self.ws = ws
+        self.pagina = ""
+        self.estados = {}  # id do widget -> (campo do WidgetState, valor)
+        self.widgets = {}  # rótulo -> (id, fragmento)
+
+    @classmethod
+    async def conectar(cls, url):
+        return cls(await websocket_connect(url, subprotocols=["streamlit"]))
+
+    def widget(self, rotulo):
+        return self.widgets[rotulo]
+
+    def definir(self, rotulo, campo, valor):
+        self.estados[self.widget(rotulo)[0]] = (campo, valor)
+
+    # Um rerun completo (ou só do fragmento) até o fim da execução, inclusive do
+    # rerun completo pedido por st.rerun(). Devolve (segundos, erros, exceções).
+    async def rerun(self, fragmento="", gatilho=None):
+        mensagem = BackMsg()
+        pedido = mensagem.rerun_script
+        pedido.page_script_hash = self.pagina
+        pedido.fragment_id = fragmento
+        for id_widget, (campo, valor) in self.estados.items():
+            estado = pedido.widget_states.widgets.add()
+            estado.id = id_widget
+            setattr(estado, campo, valor)
+        if gatilho:
+            estado = pedido.widget_states.widgets.add()
+            estado.id = gatilho
+            estado.trigger_value = True
+
+        erros, excecoes = [], []
+        inicio = time.perf_counter()
+        await self.ws.write_message(mensagem.SerializeToString(), binary=True)
+        while True:
+            bruto = await self.ws.read_message()
+            if bruto is None:
+                raise ConnectionError("O servidor fechou a conexão.")
+            recebida = ForwardMsg()
+            recebida.ParseFromString(bruto)
+            tipo = recebida.WhichOneof("type")
+            if tipo == "delta" and recebida.delta.WhichOneof("type") == "new_element":
+                self._registrar_elemento(recebida.delta.new_element, recebida.delta.fragment_id, erros, excecoes)
+            elif tipo == "script_finished" and recebida.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                return time.perf_counter() - inicio, erros, excecoes
+
+    def _registrar_elemento(self, elemento, fragmento, erros, excecoes):
+        tipo = elemento.WhichOneof("type")
+        conteudo = getattr(elemento, tipo)
+        if tipo == "alert" and conteudo.format == Alert.ERROR:
+            erros.append(conteudo.body)
+        elif tipo == "exception":
+            excecoes.append(f"{conteudo.type}: {conteudo.message}")
+        elif getattr(conteudo, "id", "") and getattr(conteudo, "label", ""):
+            self.widgets[conteudo.label] = (conteudo.id, fragmento)
+
+
+# Latências, erros e bloqueios de cada página (ou etapa) ao longo do teste
+class Medicoes:
+    def __init__(self):
+        self.latencias = defaultdict(list)
+        self.erros = defaultdict(int)
+        self.bloqueios = defaultdict(int)
+        self.exemplos = {}
+
+    def registrar(self, pagina, segundos, erros, excecoes):
+        self.latencias[pagina].append(segundos * 1000)
+        for mensagem in erros + excecoes:
+            self.erros[pagina] += 1
+            self.exemplos.setdefault(pagina, mensagem)
+            if _PADRAO_BLOQUEIO.search(mensagem):
+                self.bloqueios[pagina] += 1
+
+
+async def _medir(sessao, medicoes, pagina, **rerun):
+    medicoes.registrar(pagina, *await sessao.rerun(**rerun))
+
+
+async def _login(sessao, medicoes):
+    await _medir(sessao, medicoes, "Login")
+    sessao.definir("E-mail", "string_value", "email")
+    sessao.definir("Senha", "string_value", "senha")
+    await _medir(sessao, medicoes, "Login", gatilho=sessao.widget("Entrar")[0])
+    # Login só marca a sessão; a navegação aparece no rerun seguinte
+    sessao.estados.clear()
+
+
+async def _abrir(sessao, medicoes, titulo):
+    sessao.pagina = calc_md5(enderecos_paginas()[titulo])
+    sessao.estados.clear()
+    await _medir(sessao, medicoes, titulo)
+
+
+# Caixa registrando uma venda ou compra: abre a página, busca o produto pelo id
+# (rerun do fragmento do formulário), escolhe a quantidade e envia o formulário
+async def _movimentacao(sessao, medicoes, aleatorio):
+    await _abrir(sessao, medicoes, "Movimentações")
+    id_busca, fragmento = sessao.widget("Buscar Produto")
+    sessao.estados[id_busca] = ("string_value", str(aleatorio.randint(1, PRODUTOS)))
+    await _medir(sessao, medicoes, "Movimentações: formulário", fragmento=fragmento)
+    sessao.definir("Tipo de Movimentação", "int_value", aleatorio.choice((0, 0, 1)))  # Venda ou Compra
+    await _medir(sessao, medicoes, "Movimentações: formulário", fragmento=fragmento)
+    sessao.definir("Quantidade", "int_value", aleatorio.randint(1, 5))
+    id_enviar, fragmento = sessao.widget("Registrar Movimentação")
+    await _medir(sessao, medicoes, "Movimentações: registro", fragmento=fragmento, gatilho=id_enviar)
+
+
+ACOES = {
+    "movimentacao": _movimentacao,
+    "estoque": lambda sessao, medicoes, aleatorio: _abrir(sessao, medicoes, "Estoque"),
+    "dashboard": lambda sessao, medicoes, aleatorio: _abrir(sessao, medicoes, "Dashboard"),
+}
+
+
+async def _simular(numero, url, mistura, fim, pausa_s, medicoes, semente):
+    aleatorio = random.Random(f"{semente}-{numero}")
+    acoes, pesos = zip(*mistura.items())
+    sessao = await Sessao.conectar(url)
+    try:
+        await _login(sessao, medicoes)
+        while time.perf_counter() < fim:
+            await ACOES[aleatorio.choices(acoes, pesos)[0]](sessao, medicoes, aleatorio)
+            await asyncio.sleep(aleatorio.uniform(0, pausa_s))
+    finally:
+        sessao.ws.close()
+
+
+def _percentil(valores, percentual):
+    ordenados = sorted(valores)
+    posicao = max(0, min(len(ordenados) - 1, round(percentual / 100 * len(ordenados) + 0.5) - 1))
+    return ordenados[posicao]
+
+
+def resumir(medicoes, segundos):
+    return {
+        pagina: {
+            "reruns": len(latencias),
+            **{f"p{percentual}_ms": round(_percentil(latencias, percentual), 1) for percentual in _PERCENTIS},
+            "max_ms": round(max(latencias), 1),
+            "erros": medicoes.erros[pagina],
+            "bloqueios": medicoes.bloqueios[pagina],
+            "reruns_por_s": round(len(latencias) / segundos, 2),
+        }
+        for pagina, latencias in sorted(medicoes.latencias.items())
+    }
+
+
+# Servidor local do sistema, no banco indicado por SISTEMA_VENDAS_DB
+def iniciar_servidor(porta, timeout=TIMEOUT_S):
+    processo = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(SCRIPT), "--server.port", str(porta),
+         "--server.headless", "true", "--browser.gatherUsageStats", "false"],
+        cwd=SCRIPT.parent, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    limite = time.perf_counter() + timeout
+    while time.perf_counter() < limite:
+        try:
+            with urllib.request.urlopen(f"http://localhost:{porta}/_stcore/health", timeout=1):
+                return processo
+        except OSError:
+            if processo.poll() is not None:
+                raise RuntimeError(f"O servidor terminou com código {processo.returncode}.")
+            time.sleep(0.5)
+    processo.terminate()
+    raise TimeoutError(f"O servidor não respondeu em {timeout} s.")
+
+
+# N sessões simultâneas (como N caixas no navegador) sorteando ações da
+# `mistura` durante `duracao_s` segundos contra o servidor em `url`
+async def executar_carga(url, sessoes=SESSOES, duracao_s=DURACAO_S, mistura=MISTURA, pausa_s=PAUSA_S, semente=42):
+    medicoes = Medicoes()
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(
+        *(_simular(numero, url, mistura, inicio + duracao_s, pausa_s, medicoes, semente) for numero in range(sessoes)),
+        return_exceptions=True,
+    )
+    segundos = time.perf_counter() - inicio
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "versao": versao_codigo(),
+        "url": url,
+        "sessoes": sessoes,
+        "duracao_s": round(segundos, 1),
+        "mistura": mistura,
+        "sessoes_com_falha": [repr(resultado) for resultado in resultados if isinstance(resultado, BaseException)],
+        "paginas": resumir(medicoes, segundos),
+        "exemplos_de_erro": medicoes.exemplos,
+    }
+
+
+def _mistura(texto):
+    mistura = {}
+    for item in texto.split(","):
+        acao, _, peso = item.partition("=")
+        if acao not in ACOES:
+            raise ValueError(f"Ação desconhecida: {acao} (opções: {', '.join(ACOES)})")
+        mistura[acao] = float(peso or 1)
+    return mistura
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Teste de carga: várias sessões simultâneas contra um servidor local do sistema"
+    )
+    parser.add_argument("--sessoes", type=int, default=SESSOES, help="sessões simultâneas")
+    parser.add_argument("--duracao", type=float, default=DURACAO_S, help="segundos de carga")
+    parser.add_argument("--mistura", type=_mistura, default=MISTURA,
+                        help="ações e pesos, ex.: movimentacao=4,estoque=3,dashboard=2")
+    parser.add_argument("--pausa", type=float, default=PAUSA_S, help="pausa máxima entre ações de uma sessão")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--porta", type=int, default=PORTA, help="porta do servidor iniciado pelo teste")
+    parser.add_argument("--url", help="servidor já em execução (ex.: ws://localhost:8501/_stcore/stream)")
+    parser.add_argument("--saida", help="arquivo JSON com os resultados")
+    args = parser.parse_args()
+
+    servidor = None
+    if args.url is None:
+        print(f"Iniciando o servidor na porta {args.porta} (banco {os.environ.get('SISTEMA_VENDAS_DB', 'padrão')})...")
+        servidor = iniciar_servidor(args.porta)
+    try:
+        resultado = asyncio.run(executar_carga(
+            args.url or f"ws://localhost:{args.porta}/_stcore/stream",
+            args.sessoes, args.duracao, args.mistura, args.pausa, args.semente,
+        ))
+    finally:
+        if servidor is not None:
+            servidor.terminate()
+            servidor.wait()
+
+    print(f"\n{resultado['sessoes']} sessões em {resultado['duracao_s']} s ({resultado['versao']}):")
+    print(f"{'página':<28} {'reruns':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'erros':>6} {'bloq.':>6} {'reruns/s':>9}")
+    for pagina, medidas in resultado["paginas"].items():
+        print(f"{pagina:<28} {medidas['reruns']:>7} {medidas['p50_ms']:>9} {medidas['p95_ms']:>9} "
+              f"{medidas['p99_ms']:>9} {medidas['erros']:>6} {medidas['bloqueios']:>6} {medidas['reruns_por_s']:>9}")
+    for pagina, mensagem in resultado["exemplos_de_erro"].items():
+        print(f"Erro em {pagina}: {mensagem}")
+    for falha in resultado["sessoes_com_falha"]:
+        print(f"Sessão interrompida: {falha}")
+    if args.saida:
+        Path(args.saida).write_text(json.dumps(resultado, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"Resultados gravados em {args.saida}.")
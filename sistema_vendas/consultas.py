@@ -0,0 +1,246 @@
+from typing import NamedTuple
+
+import pandas as pd
+import pyarrow as pa
+
+from sistema_vendas import analitico
+from sistema_vendas.analitico import MOTOR_ANALITICO
+from sistema_vendas.banco import consultar_arrow, execute_query
+from sistema_vendas.esquemas import ESQUEMAS, campos
+
+
+# Indicadores do dashboard para um período
+class Indicadores(NamedTuple):
+    total_produtos: int
+    total_clientes: int
+    total_profissionais: int
+    total_custo: float
+    total_produtos_vendidos: int
+    total_produtos_comprados: int
+    total_faturamento: float
+
+
+# Leitura das consultas do dashboard no motor analítico escolhido; o SQL é o
+# mesmo nos dois motores, exceto pelas expressões de período
+def _ler(motor, query, params):
+    if motor == "duckdb":
+        return analitico.consultar(query, params)
+    return execute_query(query, params, fetch=True)
+
+
+# Todos os indicadores em uma única passada sobre o resumo diário do período
+def consultar_indicadores(data_inicio, data_fim, motor=MOTOR_ANALITICO):
+    linha = _ler(motor, """
+        WITH periodo AS (
+            SELECT tipo, quantidade, faturamento
+            FROM vendas_diarias
+            WHERE tipo IN ('Venda', 'Compra') AND dia BETWEEN ? AND ?
+        )
+        SELECT
+            (SELECT COUNT(*) FROM produtos),
+            (SELECT COUNT(*) FROM clientes),
+            (SELECT COUNT(*) FROM profissionais),
+            (SELECT SUM(preco_compra) FROM produtos),
+            SUM(CASE WHEN tipo = 'Venda' THEN quantidade END),
+            SUM(CASE WHEN tipo = 'Compra' THEN quantidade END),
+            SUM(CASE WHEN tipo = 'Venda' THEN faturamento END)
+        FROM periodo
+    """, (data_inicio, data_fim))[0]
+    # SUM devolve NULL quando não há movimentações no período
+    return Indicadores(*(valor or 0 for valor in linha))
+
+
+# Expressão SQL do período de cada granularidade, a partir de uma coluna de
+# data ISO; o mês usa a coluna gerada ano_mes, na ordem do índice
+GRANULARIDADES = {
+    "Dia": "{coluna}",
+    "Semana": "date({coluna}, 'weekday 0', '-6 days')",  # segunda-feira da semana
+    "Mês": "ano_mes",
+    "Trimestre": "substr({coluna}, 1, 4) || '-T' || ((CAST(substr({coluna}, 6, 2) AS INTEGER) + 2) / 3)",
+}
+
+
+def _periodo(granularidade, coluna, motor):
+    expressoes = analitico.GRANULARIDADES if motor == "duckdb" else GRANULARIDADES
+    return expressoes[granularidade].format(coluna=coluna)
+
+
+# Quantidade vendida e faturamento por período em uma única consulta agrupada.
+# O filtro em ano_mes delimita o trecho do índice e o filtro em dia corta os
+# dias fora do intervalo; por mês o agrupamento segue a ordem do índice.
+def consultar_vendas_periodo(data_inicio, data_fim, granularidade="Mês", motor=MOTOR_ANALITICO):
+    vendas = _ler(motor, f"""
+        SELECT {_periodo(granularidade, "dia", motor)} AS periodo, SUM(quantidade) AS total, SUM(faturamento) AS faturamento
+        FROM vendas_diarias
+        WHERE tipo = 'Venda' AND ano_mes BETWEEN substr(?1, 1, 7) AND substr(?2, 1, 7) AND dia BETWEEN ?1 AND ?2
+        GROUP BY periodo
+        ORDER BY periodo
+    """, (data_inicio, data_fim))
+    return pd.DataFrame(vendas, columns=["Período", "Total de Vendas", "Faturamento"])
+
+
+def consultar_custos_periodo(data_inicio, data_fim, granularidade="Mês", motor=MOTOR_ANALITICO):
+    custos = _ler(motor, f"""
+        SELECT {_periodo(granularidade, "data_compra", motor)} AS periodo, SUM(preco_compra) AS total
+        FROM produtos
+        WHERE ano_mes BETWEEN substr(?1, 1, 7) AND substr(?2, 1, 7) AND data_compra BETWEEN ?1 AND ?2
+        GROUP BY periodo
+        ORDER BY periodo
+    """, (data_inicio, data_fim))
+    return pd.DataFrame(custos, columns=["Período", "Total de Custos"])
+
+
+# Empates no total ficam na ordem do nome, igual nos dois motores
+def consultar_vendas_por_marca(data_inicio, data_fim, motor=MOTOR_ANALITICO):
+    vendas = _ler(motor, """
+        SELECT p.marca, SUM(v.quantidade) AS total
+        FROM vendas_diarias v
+        JOIN produtos p ON v.id_produto = p.id
+        WHERE v.tipo = 'Venda' AND v.dia BETWEEN ? AND ?
+        GROUP BY p.marca
+        ORDER BY total DESC, p.marca NULLS LAST
+    """, (data_inicio, data_fim))
+    return pd.DataFrame(vendas, columns=["Marca", "Total de Vendas"])
+
+
+def consultar_vendas_por_tamanho(data_inicio, data_fim, motor=MOTOR_ANALITICO):
+    vendas = _ler(motor, """
+        SELECT p.tamanho, SUM(v.quantidade) AS total
+        FROM vendas_diarias v
+        JOIN produtos p ON v.id_produto = p.id
+        WHERE v.tipo = 'Venda' AND v.dia BETWEEN ? AND ?
+        GROUP BY p.tamanho
+        ORDER BY total DESC, p.tamanho NULLS LAST
+    """, (data_inicio, data_fim))
+    return pd.DataFrame(vendas, columns=["Tamanho", "Total de Vendas"])
+
+
+# Colunas da consulta de estoque: dados do produto e o saldo
+ESQUEMA_ESTOQUE = pa.schema(
+    campos("produtos", "id", "nome", "marca", "tamanho", "preco_compra", "preco_venda") + [("saldo", pa.int64())]
+)
+
+
+# Produtos com saldo positivo: o saldo mantido em `saldo_produtos` junto com os
+# dados dos produtos, direto para uma tabela Arrow
+def consultar_estoque():
+    return consultar_arrow("""
+        SELECT p.id, p.nome, p.marca, p.tamanho, p.preco_compra, p.preco_venda, s.saldo
+        FROM saldo_produtos s
+        JOIN produtos p ON p.id = s.id_produto
+        WHERE s.saldo > 0
+        ORDER BY s.id_produto
+    """, ESQUEMA_ESTOQUE)
+
+
+LIMITE_BUSCA = 20
+
+
+# Primeiros `limite` registros cujo nome começa com `texto` (sem diferenciar
+# maiúsculas), em ordem alfabética. A faixa [texto, texto + maior caractere)
+# percorre só o trecho correspondente do índice NOCASE de `nome`.
+def _buscar_por_nome(tabela, texto, limite):
+    return execute_query(f"""
+        SELECT id, nome
+        FROM {tabela}
+        WHERE nome >= ? COLLATE NOCASE AND nome < ? COLLATE NOCASE
+        ORDER BY nome COLLATE NOCASE
+        LIMIT ?
+    """, (texto, texto + "\U0010ffff", limite), fetch=True)
+
+
+# Opções do seletor de produtos: (id, "id – nome"); um número digitado também busca pelo id
+def buscar_produtos(texto="", limite=LIMITE_BUSCA):
+    linhas = []
+    if texto.isdigit():
+        linhas = execute_query("SELECT id, nome FROM produtos WHERE id = ?", (int(texto),), fetch=True)
+    linhas += [linha for linha in _buscar_por_nome("produtos", texto, limite) if linha not in linhas]
+    return [(id_produto, f"{id_produto} – {nome}") for id_produto, nome in linhas[:limite]]
+
+
+# Opções dos seletores de clientes e profissionais: (nome, "id – nome")
+def buscar_clientes(texto="", limite=LIMITE_BUSCA):
+    return [(nome, f"{id_cliente} – {nome}") for id_cliente, nome in _buscar_por_nome("clientes", texto, limite)]
+
+
+def buscar_profissionais(texto="", limite=LIMITE_BUSCA):
+    return [(nome, f"{id_prof} – {nome}") for id_prof, nome in _buscar_por_nome("profissionais", texto, limite)]
+
+
+# Filtros do histórico de movimentações (None = sem filtro)
+class FiltrosHistorico(NamedTuple):
+    id_produto: int | None = None
+    tipo: str | None = None
+    data_inicio: str | None = None
+    data_fim: str | None = None
+    profissional: str | None = None
+
+
+# Padrão LIKE para "começa com `texto`", com % e _ digitados tratados como texto
+def _prefixo_like(texto):
+    return texto.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _condicoes_historico(filtros):
+    condicoes, params = [], []
+    if filtros.id_produto:
+        condicoes.append("m.id_produto = ?")
+        params.append(filtros.id_produto)
+    if filtros.tipo:
+        condicoes.append("m.tipo = ?")
+        params.append(filtros.tipo)
+    if filtros.data_inicio and filtros.data_fim:
+        condicoes.append("m.data BETWEEN ? AND ?")
+        params.extend([filtros.data_inicio, filtros.data_fim])
+    if filtros.profissional:
+        # Prefixo como parâmetro (não `? || '%'`) para o SQLite usar o índice do profissional
+        condicoes.append("m.profissional LIKE ? ESCAPE '\\'")
+        params.append(_prefixo_like(filtros.profissional))
+    return condicoes, params
+
+
+# Maior id possível no SQLite: a primeira página usa o mesmo comando das demais
+MAIOR_ID = 2**63 - 1
+
+
+# Uma página do histórico, da movimentação mais recente para a mais antiga.
+# Paginação por chave: a próxima página começa depois do último id exibido
+# (`antes_de_id`), sem OFFSET; o id (rowid) é percorrido pelo índice do filtro.
+# Devolve (tabela Arrow, existe_proxima_pagina).
+def consultar_historico(filtros, antes_de_id=None, tamanho_pagina=50):
+    condicoes, params = _condicoes_historico(filtros)
+    condicoes.append("m.id < ?")
+    params.append(MAIOR_ID if antes_de_id is None else antes_de_id)
+    where = f"WHERE {' AND '.join(condicoes)}"
+    if filtros.profissional and not filtros.id_produto:
+        # Com LIMIT ? o SQLite prefere percorrer o id em ordem, o que lê a tabela
+        # inteira quando o nome é raro. O prefixo delimita as linhas no índice do
+        # profissional e só os ids encontrados são ordenados (top-N do LIMIT).
+        # Com produto, o índice do produto já entrega poucas linhas na ordem do id.
+        where = f"""WHERE m.id IN (
+            SELECT m.id FROM movimentacoes m INDEXED BY idx_movimentacoes_profissional
+            {where}
+            ORDER BY m.id DESC
+            LIMIT ?
+        )"""
+        params.append(tamanho_pagina + 1)
+    tabela = consultar_arrow(f"""
+        SELECT m.id, m.id_produto, m.tipo, m.quantidade, m.profissional, m.cliente, m.data
+        FROM movimentacoes m
+        {where}
+        ORDER BY m.id DESC
+        LIMIT ?
+    """, ESQUEMAS["movimentacoes"], (*params, tamanho_pagina + 1))
+    return tabela.slice(0, tamanho_pagina), tabela.num_rows > tamanho_pagina
+
+
+# Total de movimentações com os filtros. Sem filtros vem da contagem mantida
+# pelos gatilhos; com filtros conta as linhas, por isso a página só chama
+# quando pedido.
+def contar_historico(filtros):
+    condicoes, params = _condicoes_historico(filtros)
+    if not condicoes:
+        linha = execute_query("SELECT total FROM contagem_movimentacoes WHERE id = 1", fetch=True)
+        return linha[0][0] if linha else 0
+    where = f"WHERE {' AND '.join(condicoes)}"
+    return execute_query(f"SELECT COUNT(*) FROM movimentacoes m {where}", params, fetch=True)[0][0]
@@ -0,0 +1,56 @@
+import pyarrow as pa
+
+
+# Tipos Arrow das colunas das tabelas principais, usados na leitura direta para
+# Arrow (st.dataframe) e na exportação Parquet. As datas de produtos e
+# movimentações são ISO garantido pelo CHECK e viram date32; as de clientes não
+# têm essa garantia no banco e ficam como texto.
+ESQUEMAS = {
+    "produtos": pa.schema([
+        ("id", pa.int64()),
+        ("nome", pa.string()),
+        ("marca", pa.string()),
+        ("tamanho", pa.string()),
+        ("preco_compra", pa.float64()),
+        ("preco_venda", pa.float64()),
+        ("data_compra", pa.date32()),
+    ]),
+    "clientes": pa.schema([
+        ("id", pa.int64()),
+        ("nome", pa.string()),
+        ("cpf", pa.string()),
+        ("endereco", pa.string()),
+        ("email", pa.string()),
+        ("telefone", pa.string()),
+        ("data_nascimento", pa.string()),
+        ("data_cadastro", pa.string()),
+    ]),
+    "movimentacoes": pa.schema([
+        ("id", pa.int64()),
+        ("id_produto", pa.int64()),
+        ("tipo", pa.string()),
+        ("quantidade", pa.int64()),
+        ("profissional", pa.string()),
+        ("cliente", pa.string()),
+        ("data", pa.date32()),
+    ]),
+}
+
+
+# Campos de uma tabela, para montar o esquema de uma consulta com junções
+def campos(tabela, *nomes):
+    return [ESQUEMAS[tabela].field(nome) for nome in nomes]
+
+
+def _coluna(valores, tipo):
+    # Datas chegam do SQLite como texto ISO e são convertidas pelo Arrow
+    if pa.types.is_date(tipo):
+        return pa.array(valores, type=pa.string()).cast(tipo)
+    return pa.array(valores, type=tipo)
+
+
+# Lote de linhas (tuplas do cursor) convertido em colunas Arrow com o esquema dado
+def lote_arrow(linhas, esquema):
+    return pa.record_batch(
+        [_coluna(valores, campo.type) for valores, campo in zip(zip(*linhas), esquema)], schema=esquema
+    )
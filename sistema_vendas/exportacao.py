@@ -0,0 +1,125 @@
+import csv
+import gzip
+import io
+import time
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from decouple import config
+
+from sistema_vendas.banco import get_db, init_db
+from sistema_vendas.esquemas import ESQUEMAS, lote_arrow
+
+
+TAMANHO_LOTE = 10_000
+TABELAS_EXPORTACAO = ("clientes", "produtos", "movimentacoes")
+
+# Extensão e tipo MIME de cada formato
+FORMATOS_EXPORTACAO = {
+    "csv": (".csv", "text/csv"),
+    "csv.gz": (".csv.gz", "application/gzip"),
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+}
+
+# Linhas que as páginas exportam: o st.download_button do Streamlit carrega o
+# arquivo inteiro em memória e o servidor guarda outra cópia até o download,
+# então tabelas maiores são exportadas pela linha de comando
+LIMITE_EXPORTACAO_TELA = config("SISTEMA_VENDAS_LIMITE_EXPORTACAO_TELA", default=100_000, cast=int)
+
+
+# Exportação interrompida por passar do limite de linhas pedido
+class LimiteExportacaoExcedido(ValueError):
+    pass
+
+
+def _lotes(cursor, tamanho_lote):
+    while True:
+        linhas = cursor.fetchmany(tamanho_lote)
+        if not linhas:
+            return
+        yield linhas
+
+
+# Exporta a tabela para `destino` (caminho ou arquivo binário) lendo `tamanho_lote`
+# linhas por vez, de modo que a memória usada não depende do tamanho da tabela.
+# Com `limite`, desiste (LimiteExportacaoExcedido) ao passar desse número de
+# linhas. Devolve o número de linhas exportadas.
+def exportar(tabela, formato, destino, tamanho_lote=TAMANHO_LOTE, limite=None):
+    if tabela not in TABELAS_EXPORTACAO:
+        raise ValueError(f"Tabela não exportável: {tabela}")
+    total = 0
+    with get_db().leitura() as conn:
+        esquema = ESQUEMAS[tabela]
+        query = f"SELECT {', '.join(esquema.names)} FROM {tabela} ORDER BY id"
+        # Uma linha além do limite basta para saber que ele foi excedido
+        cursor = conn.execute(query, ()) if limite is None else conn.execute(f"{query} LIMIT ?", (limite + 1,))
+        try:
+            if formato == "parquet":
+                with pq.ParquetWriter(destino, esquema) as escritor:
+                    for linhas in _lotes(cursor, tamanho_lote):
+                        escritor.write_batch(lote_arrow(linhas, esquema))
+                        total += len(linhas)
+            else:
+                total = _exportar_csv(cursor, esquema, formato, destino, tamanho_lote)
+        finally:
+            cursor.close()
+    if limite is not None and total > limite:
+        raise LimiteExportacaoExcedido(
+            f"{tabela} tem mais de {limite} linhas; exporte pela linha de comando: "
+            f"python -m sistema_vendas.exportacao {tabela} {tabela}{FORMATOS_EXPORTACAO[formato][0]}"
+        )
+    return total
+
+
+def _exportar_csv(cursor, esquema, formato, destino, tamanho_lote):
+    total = 0
+    compactado = gzip.open(destino, "wb") if formato == "csv.gz" else None
+    try:
+        if compactado is not None:
+            arquivo = io.TextIOWrapper(compactado, encoding="utf-8", newline="")
+        elif isinstance(destino, (str, Path)):
+            arquivo = open(destino, "w", encoding="utf-8", newline="")
+        else:
+            arquivo = io.TextIOWrapper(destino, encoding="utf-8", newline="", write_through=True)
+        try:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(esquema.names)
+            for linhas in _lotes(cursor, tamanho_lote):
+                escritor.writerows(linhas)
+                total += len(linhas)
+        finally:
+            if compactado is None and not isinstance(destino, (str, Path)):
+                # Não fecha o arquivo binário de quem chamou
+                arquivo.flush()
+                arquivo.detach()
+            else:
+                arquivo.close()
+    finally:
+        # Grava o final do gzip; fechar o GzipFile não fecha o arquivo de quem chamou
+        if compactado is not None:
+            compactado.close()
+    return total
+
+
+def formato_do_arquivo(nome):
+    nome = nome.lower()
+    for formato, (extensao, _) in sorted(FORMATOS_EXPORTACAO.items(), key=lambda item: -len(item[1][0])):
+        if nome.endswith(extensao):
+            return formato
+    return "csv"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Exportação de clientes, produtos e movimentações")
+    parser.add_argument("tabela", choices=TABELAS_EXPORTACAO)
+    parser.add_argument("arquivo", help="destino (.csv, .csv.gz ou .parquet)")
+    parser.add_argument("--formato", choices=list(FORMATOS_EXPORTACAO), help="padrão: pela extensão do arquivo")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE, help="linhas lidas por vez")
+    args = parser.parse_args()
+
+    init_db()
+    inicio = time.perf_counter()
+    total = exportar(args.tabela, args.formato or formato_do_arquivo(args.arquivo), args.arquivo, args.lote)
+    print(f"{total} linhas exportadas para {args.arquivo} em {time.perf_counter() - inicio:.1f} s.")
@@ -0,0 +1,118 @@
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextvars import copy_context
+from typing import NamedTuple
+
+from sistema_vendas.cache_consultas import tabela_escrita
+
+
+TAMANHO_LOTE = 100  # comandos gravados em uma mesma transação
+TENTATIVAS = 3  # tentativas de abrir a transação com o banco ocupado por outro processo
+ESPERA_TENTATIVA_S = 0.5
+
+
+# Fila cheia por mais tempo do que a espera configurada: a escrita não foi
+# enfileirada. É um sqlite3.Error para cair no mesmo tratamento de erro das páginas.
+class FilaEscritaCheia(sqlite3.OperationalError):
+    pass
+
+
+class Comando(NamedTuple):
+    query: str
+    params: object
+    em_lote: bool  # params é uma lista de linhas (executemany)
+    contexto: object  # contexto de quem enviou, para a instrumentação saber a página
+    futuro: Future
+
+
+def _ocupado(erro):
+    codigo = getattr(erro, "sqlite_errorcode", None)
+    return codigo is not None and codigo & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+
+
+class FilaEscrita:
+    # Uma thread em segundo plano grava os comandos enviados pelas sessões. Os
+    # comandos que se acumulam enquanto uma transação é gravada entram juntos na
+    # próxima (commit em grupo); cada um roda em um SAVEPOINT, então o erro de um
+    # comando não desfaz os demais. O resultado (linhas alteradas) ou o erro de
+    # cada comando chega a quem enviou pelo seu Future, depois do COMMIT. A fila
+    # é limitada: com ela cheia, quem envia espera até `espera_s` segundos.
+    def __init__(self, db, tamanho, espera_s, tamanho_lote=TAMANHO_LOTE):
+        self._db = db
+        self._fila = queue.Queue(maxsize=tamanho)
+        self.espera_s = espera_s
+        self.tamanho_lote = tamanho_lote
+        threading.Thread(target=self._executar, name="fila-escrita", daemon=True).start()
+
+    def enviar(self, query, params=None, em_lote=False):
+        futuro = Future()
+        try:
+            self._fila.put(Comando(query, params, em_lote, copy_context(), futuro), timeout=self.espera_s)
+        except queue.Full:
+            raise FilaEscritaCheia("Fila de escrita cheia; tente novamente em instantes.") from None
+        return futuro
+
+    def pendentes(self):
+        return self._fila.qsize()
+
+    def _executar(self):
+        while True:
+            comandos = [self._fila.get()]
+            while len(comandos) < self.tamanho_lote:
+                try:
+                    comandos.append(self._fila.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._gravar(comandos)
+            except BaseException as e:
+                # A thread continua viva; o erro vai para quem ainda espera
+                for comando in comandos:
+                    if not comando.futuro.done():
+                        comando.futuro.set_exception(e)
+
+    def _gravar(self, comandos):
+        tabelas = {tabela_escrita(comando.query) for comando in comandos}
+        # Algum comando sem tabela identificada: todo o cache de consultas é descartado
+        tabelas = () if None in tabelas else tuple(tabelas)
+        for tentativa in range(1, TENTATIVAS + 1):
+            try:
+                with self._db.escrita(*tabelas) as conn:
+                    resultados = [self._executar_comando(conn, comando) for comando in comandos]
+                break
+            except sqlite3.OperationalError as e:
+                # Outro processo (importação, gerador) segurando o banco além do busy_timeout
+                if not _ocupado(e) or tentativa == TENTATIVAS:
+                    raise
+                time.sleep(ESPERA_TENTATIVA_S * tentativa)
+        for comando, resultado in zip(comandos, resultados):
+            if isinstance(resultado, Exception):
+                comando.futuro.set_exception(resultado)
+            else:
+                comando.futuro.set_result(resultado)
+
+    def _executar_comando(self, conn, comando):
+        conn.execute("SAVEPOINT comando")
+        try:
+            linhas = comando.contexto.run(self._medir, conn, comando)
+        except sqlite3.Error as e:
+            conn.execute("ROLLBACK TO comando")
+            conn.execute("RELEASE comando")
+            return e
+        conn.execute("RELEASE comando")
+        return linhas
+
+    def _medir(self, conn, comando):
+        inicio = time.perf_counter()
+        if comando.em_lote:
+            cursor = conn.executemany(comando.query, comando.params)
+            params = comando.params[0] if comando.params else None
+        else:
+            cursor = conn.execute(comando.query, comando.params or ())
+            params = comando.params
+        linhas = max(cursor.rowcount, 0)
+        self._db.instrumentacao.registrar(comando.query, time.perf_counter() - inicio, linhas, conn, params)
+        return linhas
@@ -0,0 +1,189 @@
+import random
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+from sistema_vendas.banco import (
+    DB_NAME,
+    execute_query,
+    atualizar_esquema,
+    get_db,
+    init_db,
+    reconstruir_saldos,
+    reconstruir_vendas_diarias,
+)
+
+
+TAMANHO_LOTE = 100_000
+
+# Quantidades padrão: um banco "grande" de referência para os benchmarks
+QUANTIDADES_PADRAO = {
+    "produtos": 10_000,
+    "clientes": 100_000,
+    "profissionais": 50,
+    "movimentacoes": 5_000_000,
+}
+
+_PRENOMES = (
+    "Ana", "Beatriz", "Bruno", "Camila", "Carlos", "Daniel", "Eduarda", "Felipe", "Fernanda", "Gabriel",
+    "Helena", "Igor", "Isabela", "João", "José", "Juliana", "Larissa", "Lucas", "Luíza", "Marcos",
+    "Maria", "Mateus", "Natália", "Paulo", "Rafael", "Renata", "Rodrigo", "Sofia", "Thiago", "Vitória",
+)
+_SOBRENOMES = (
+    "Almeida", "Alves", "Araújo", "Barbosa", "Cardoso", "Carvalho", "Castro", "Costa", "Dias", "Ferreira",
+    "Gomes", "Lima", "Martins", "Melo", "Moreira", "Nascimento", "Oliveira", "Pereira", "Ribeiro", "Rocha",
+    "Rodrigues", "Santos", "Silva", "Soares", "Souza",
+)
+_ITENS = ("GARRAFA", "COPO", "CANECA", "TERMO", "MOCHILA", "BOLSA", "CAMISETA", "BONÉ", "TOALHA", "ESTOJO")
+_MARCAS = ("STANLEY", "PACCO", "TUPPERWARE", "CONTIGO", "NIKE", "ADIDAS", "PUMA", "OXFORD", "TRAMONTINA")
+_TAMANHOS = ("P", "M", "G", "GG", "350 ML", "500 ML", "800 ML", "1 L")
+_AREAS = ("Vendas", "Estoque", "Atendimento", "Gerência")
+
+
+def _nome(aleatorio):
+    return f"{aleatorio.choice(_PRENOMES)} {aleatorio.choice(_SOBRENOMES)} {aleatorio.choice(_SOBRENOMES)}"
+
+
+def _data(aleatorio, inicio, dias):
+    return (inicio + timedelta(days=aleatorio.randrange(dias))).isoformat()
+
+
+def _produtos(aleatorio, quantidade, inicio, dias):
+    for _ in range(quantidade):
+        preco_compra = round(aleatorio.uniform(5, 300), 2)
+        yield (
+            f"{aleatorio.choice(_ITENS)} {aleatorio.randrange(1000):03d}",
+            aleatorio.choice(_MARCAS),
+            aleatorio.choice(_TAMANHOS),
+            preco_compra,
+            round(preco_compra * aleatorio.uniform(1.2, 2.5), 2),
+            _data(aleatorio, inicio, dias),
+        )
+
+
+def _clientes(aleatorio, quantidade, inicio, dias):
+    for numero in range(1, quantidade + 1):
+        yield (
+            _nome(aleatorio),
+            f"{numero:011d}",
+            f"Rua {aleatorio.randrange(1, 2000)}, {aleatorio.randrange(1, 999)}",
+            f"cliente{numero}@exemplo.com",
+            f"85 9{aleatorio.randrange(10**8):08d}",
+            _data(aleatorio, date(1950, 1, 1), 20000),
+            _data(aleatorio, inicio, dias),
+        )
+
+
+def _profissionais(aleatorio, quantidade, inicio, dias):
+    for numero in range(1, quantidade + 1):
+        yield (
+            _nome(aleatorio),
+            aleatorio.choice(("Feminino", "Masculino")),
+            aleatorio.choice(_AREAS),
+            f"9{numero:010d}",
+            f"85 9{aleatorio.randrange(10**8):08d}",
+            _data(aleatorio, date(1960, 1, 1), 15000),
+            f"Rua {aleatorio.randrange(1, 2000)}",
+            None,
+            _data(aleatorio, inicio, dias),
+        )
+
+
+def _movimentacoes(aleatorio, quantidade, total_produtos, profissionais, clientes, inicio, dias):
+    for _ in range(quantidade):
+        # Poucos produtos concentram a maior parte das vendas
+        id_produto = min(int(aleatorio.paretovariate(1.2)), total_produtos)
+        id_produto = aleatorio.randrange(1, total_produtos + 1) if id_produto == 1 else id_produto
+        if aleatorio.random() < 0.7:
+            yield (id_produto, "Venda", aleatorio.randint(1, 3), aleatorio.choice(profissionais),
+                   aleatorio.choice(clientes), _data(aleatorio, inicio, dias))
+        else:
+            yield (id_produto, "Compra", aleatorio.randint(5, 50), aleatorio.choice(profissionais),
+                   None, _data(aleatorio, inicio, dias))
+
+
+_COMANDOS = {
+    "produtos": "INSERT INTO produtos (nome, marca, tamanho, preco_compra, preco_venda, data_compra) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+    "clientes": "INSERT INTO clientes (nome, cpf, endereco, email, telefone, data_nascimento, data_cadastro) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+    "profissionais": "INSERT INTO profissionais (nome, genero, area_atuacao, cpf, telefone, data_nascimento, "
+                     "endereco, observacao, data_cadastro) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "movimentacoes": "INSERT INTO movimentacoes (id_produto, tipo, quantidade, profissional, cliente, data) "
+                     "VALUES (?, ?, ?, ?, ?, ?)",
+}
+
+
+def _gravar(tabela, linhas, tamanho_lote):
+    total = 0
+    while lote := list(islice(linhas, tamanho_lote)):
+        with get_db().escrita(tabela) as conn:
+            conn.executemany(_COMANDOS[tabela], lote)
+        total += len(lote)
+        print(f"  {tabela}: {total} linhas", end="\r", flush=True)
+    print()
+    return total
+
+
+# Preenche o banco atual (DB_NAME) com dados sintéticos reproduzíveis: a mesma
+# semente e as mesmas quantidades geram sempre o mesmo conteúdo. O banco precisa
+# estar vazio para não misturar dados reais com dados gerados.
+def gerar(quantidades=QUANTIDADES_PADRAO, semente=42, fim=date(2024, 12, 31), dias=730,
+          tamanho_lote=TAMANHO_LOTE):
+    init_db()
+    for tabela in _COMANDOS:
+        if execute_query(f"SELECT EXISTS (SELECT 1 FROM {tabela})", fetch=True)[0][0]:
+            raise ValueError(f"O banco {DB_NAME} já tem dados em {tabela}; use um arquivo novo.")
+
+    inicio = fim - timedelta(days=dias - 1)
+    # Cada tabela tem sua própria semente derivada, de modo que a quantidade de
+    # uma tabela não altera o conteúdo das outras
+    sementes = {tabela: random.Random(f"{semente}-{tabela}") for tabela in _COMANDOS}
+    _gravar("produtos", _produtos(sementes["produtos"], quantidades["produtos"], inicio, dias), tamanho_lote)
+    _gravar("clientes", _clientes(sementes["clientes"], quantidades["clientes"], inicio, dias), tamanho_lote)
+    _gravar("profissionais", _profissionais(
+        sementes["profissionais"], quantidades["profissionais"], inicio, dias
+    ), tamanho_lote)
+
+    # Movimentações referenciam nomes já gravados (como faz o formulário)
+    profissionais = [linha[0] for linha in execute_query("SELECT nome FROM profissionais ORDER BY id", fetch=True)]
+    clientes = [linha[0] for linha in execute_query("SELECT nome FROM clientes ORDER BY id", fetch=True)] or [None]
+    if quantidades["movimentacoes"] and (not quantidades["produtos"] or not profissionais):
+        raise ValueError("Movimentações exigem pelo menos um produto e um profissional.")
+    # Carga sem os gatilhos de saldo e resumo diário (que dominariam o tempo em
+    # milhões de linhas); atualizar_esquema() os recria e os resumos são refeitos de uma vez
+    with get_db().escrita(esquema=True) as conn:
+        gatilhos = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'movimentacoes'"
+        ).fetchall()
+        for (gatilho,) in gatilhos:
+            conn.execute(f"DROP TRIGGER {gatilho}")
+    try:
+        _gravar("movimentacoes", _movimentacoes(
+            sementes["movimentacoes"], quantidades["movimentacoes"], quantidades["produtos"],
+            profissionais, clientes, inicio, dias,
+        ), tamanho_lote)
+    finally:
+        atualizar_esquema()
+    reconstruir_saldos()
+    reconstruir_vendas_diarias()
+    with get_db().escrita(esquema=True) as conn:
+        conn.execute("PRAGMA optimize")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Gera dados sintéticos reproduzíveis no banco indicado por SISTEMA_VENDAS_DB"
+    )
+    for tabela, padrao in QUANTIDADES_PADRAO.items():
+        parser.add_argument(f"--{tabela}", type=int, default=padrao, help=f"padrão: {padrao}")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--fim", type=date.fromisoformat, default=date(2024, 12, 31), help="última data gerada")
+    parser.add_argument("--dias", type=int, default=730, help="dias cobertos pelas datas geradas")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    gerar({tabela: getattr(args, tabela) for tabela in QUANTIDADES_PADRAO}, args.semente, args.fim, args.dias)
+    print(f"Banco {DB_NAME} gerado em {time.perf_counter() - inicio:.1f} s.")
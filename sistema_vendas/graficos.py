@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+
+# Pontos por série acima dos quais o gráfico é reduzido antes de ir ao navegador
+PONTOS_GRAFICO = 500
+
+
+# Largest-Triangle-Three-Buckets: escolhe `limite` pontos da série (`x`, `y`)
+# preservando a forma do gráfico, inclusive picos e vales. O primeiro e o último
+# ponto são mantidos; de cada balde intermediário fica o ponto que forma o maior
+# triângulo com o ponto escolhido no balde anterior e a média do balde seguinte.
+# As áreas usam os valores de `x`, que podem ter intervalos irregulares (dias
+# sem venda não vêm na série). Devolve os índices escolhidos, em ordem.
+def lttb(x, y, limite=PONTOS_GRAFICO):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    total = len(y)
+    if limite >= total or limite < 3:
+        return np.arange(total)
+    bordas = np.linspace(1, total - 1, limite - 1).astype(np.int64)
+    indices = np.empty(limite, dtype=np.int64)
+    indices[0], indices[-1] = 0, total - 1
+    anterior = 0
+    for balde in range(limite - 2):
+        inicio, fim = bordas[balde], bordas[balde + 1]
+        seguinte = slice(fim, bordas[balde + 2]) if balde + 2 < len(bordas) else slice(total - 1, total)
+        media_x, media_y = x[seguinte].mean(), y[seguinte].mean()
+        areas = np.abs(
+            (x[anterior] - media_x) * (y[inicio:fim] - y[anterior])
+            - (x[anterior] - x[inicio:fim]) * (media_y - y[anterior])
+        )
+        anterior = inicio + int(areas.argmax())
+        indices[balde + 1] = anterior
+    return indices
+
+
+# Posição no eixo x, em dias, dos períodos das séries do dashboard: datas (dia
+# ou semana), meses ("2024-04") pelo primeiro dia e trimestres ("2024-T2") pelo
+# primeiro dia do trimestre
+def posicoes_periodo(periodos):
+    texto = pd.Series(periodos).astype(str)
+    trimestre = texto.str.extract(r"^(\d{4})-T([1-4])$")
+    primeiro_mes = trimestre[1].astype(float).mul(3).sub(2).map("{:02.0f}".format)
+    texto = texto.mask(trimestre[0].notna(), trimestre[0] + "-" + primeiro_mes)
+    datas = pd.to_datetime(texto, format="ISO8601")
+    return datas.to_numpy().astype("datetime64[D]").astype(np.int64)
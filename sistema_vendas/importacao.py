@@ -0,0 +1,198 @@
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from sistema_vendas.banco import enviar_escrita, execute_query, init_db
+from sistema_vendas.planilhas import texto_para_numero
+
+
+TAMANHO_LOTE = 10_000
+
+# Colunas aceitas por tabela: nome -> (tipo, obrigatória)
+ESQUEMAS_IMPORTACAO = {
+    "produtos": {
+        "nome": ("texto", True),
+        "marca": ("texto", False),
+        "tamanho": ("texto", False),
+        "preco_compra": ("real", True),
+        "preco_venda": ("real", True),
+        "data_compra": ("data", True),
+    },
+    "clientes": {
+        "nome": ("texto", True),
+        "cpf": ("texto", True),
+        "endereco": ("texto", True),
+        "email": ("texto", True),
+        "telefone": ("texto", True),
+        "data_nascimento": ("data", True),
+        "data_cadastro": ("data", False),
+    },
+    "movimentacoes": {
+        "id_produto": ("inteiro", True),
+        "tipo": ("texto", True),
+        "quantidade": ("inteiro", True),
+        "profissional": ("texto", True),
+        "cliente": ("texto", False),
+        "data": ("data", True),
+    },
+}
+
+# Regras de negócio aplicadas a colunas já convertidas: (coluna, teste vetorizado, motivo)
+REGRAS_IMPORTACAO = {
+    "produtos": [
+        ("preco_compra", lambda valores: valores > 0, "preco_compra deve ser maior que zero"),
+        ("preco_venda", lambda valores: valores > 0, "preco_venda deve ser maior que zero"),
+    ],
+    "clientes": [],
+    "movimentacoes": [
+        ("tipo", lambda valores: valores.isin(["Venda", "Compra"]), "tipo deve ser Venda ou Compra"),
+        ("quantidade", lambda valores: valores >= 1, "quantidade deve ser pelo menos 1"),
+    ],
+}
+
+
+# Resumo de um lote importado
+class ResultadoLote(NamedTuple):
+    numero: int
+    lidas: int
+    importadas: int
+    rejeitadas: int
+    segundos: float
+
+    @property
+    def linhas_por_segundo(self):
+        return self.lidas / self.segundos if self.segundos else 0.0
+
+
+def _ler_lotes(fonte, formato, tamanho_lote):
+    if formato == "parquet":
+        for lote in pq.ParquetFile(fonte).iter_batches(batch_size=tamanho_lote):
+            yield lote.to_pandas()
+    else:
+        # Tudo como texto; a conversão de tipos é feita na validação
+        yield from pd.read_csv(
+            fonte, chunksize=tamanho_lote, dtype=str, keep_default_na=False, encoding="utf-8-sig"
+        )
+
+
+def _marcar(motivos, mascara, motivo):
+    return motivos.mask(mascara, motivos + motivo + "; ")
+
+
+def _converter(texto, tipo):
+    if tipo == "texto":
+        return texto
+    if tipo in ("inteiro", "real"):
+        # Mesma leitura das planilhas editáveis: aceita vírgula decimal
+        numeros = texto_para_numero(texto)
+        if tipo == "inteiro":
+            numeros = numeros.where(numeros % 1 == 0)
+        return numeros
+    # Datas em ISO (AAAA-MM-DD) ou no formato brasileiro (DD/MM/AAAA)
+    datas = pd.to_datetime(texto, errors="coerce", format="ISO8601")
+    brasileiras = pd.to_datetime(texto.where(datas.isna()), errors="coerce", format="%d/%m/%Y")
+    return datas.fillna(brasileiras)
+
+
+# Valida um lote inteiro de uma vez; devolve (linhas válidas prontas para gravar, motivos por linha)
+def validar_lote(lote, tabela, ids_produtos=None):
+    esquema = ESQUEMAS_IMPORTACAO[tabela]
+    lote = lote.rename(columns=lambda coluna: str(coluna).strip().lower())
+    motivos = pd.Series("", index=lote.index, dtype="string")
+    valores = {}
+    for coluna, (tipo, obrigatoria) in esquema.items():
+        if coluna in lote:
+            texto = lote[coluna].astype("string").str.strip().replace("", pd.NA)
+        else:
+            texto = pd.Series(pd.NA, index=lote.index, dtype="string")
+        convertido = _converter(texto, tipo)
+        vazio = texto.isna()
+        if obrigatoria:
+            motivos = _marcar(motivos, vazio, f"{coluna} obrigatório")
+        motivos = _marcar(motivos, ~vazio & convertido.isna(), f"{coluna} inválido")
+        valores[coluna] = convertido
+
+    for coluna, teste, motivo in REGRAS_IMPORTACAO[tabela]:
+        presentes = valores[coluna].notna()
+        motivos = _marcar(motivos, presentes & ~teste(valores[coluna]).fillna(False), motivo)
+    if ids_produtos is not None:
+        presentes = valores["id_produto"].notna()
+        motivos = _marcar(motivos, presentes & ~valores["id_produto"].isin(ids_produtos), "produto inexistente")
+
+    validas = pd.DataFrame(valores)[motivos == ""].copy()
+    for coluna, (tipo, _) in esquema.items():
+        if tipo == "data":
+            validas[coluna] = validas[coluna].dt.strftime("%Y-%m-%d")
+        elif tipo == "inteiro":
+            validas[coluna] = validas[coluna].astype("Int64")
+    if tabela == "clientes":
+        validas["data_cadastro"] = validas["data_cadastro"].fillna(datetime.today().strftime("%Y-%m-%d"))
+    return validas, motivos.str.rstrip("; ")
+
+
+# Importa o arquivo em lotes, cada um em sua própria transação.
+# Gera (ResultadoLote, DataFrame das linhas rejeitadas com o motivo) a cada lote.
+def importar(fonte, tabela, formato="csv", tamanho_lote=TAMANHO_LOTE):
+    colunas = list(ESQUEMAS_IMPORTACAO[tabela])
+    ids_produtos = None
+    if tabela == "movimentacoes":
+        ids_produtos = pd.Index([linha[0] for linha in execute_query("SELECT id FROM produtos", fetch=True)])
+    comando = f"INSERT INTO {tabela} ({', '.join(colunas)}) VALUES ({', '.join('?' * len(colunas))})"
+
+    inicio_lote = 0
+    for numero, lote in enumerate(_ler_lotes(fonte, formato, tamanho_lote), start=1):
+        inicio = time.perf_counter()
+        lote.index = pd.RangeIndex(inicio_lote + 1, inicio_lote + len(lote) + 1, name="linha")
+        inicio_lote += len(lote)
+
+        validas, motivos = validar_lote(lote, tabela, ids_produtos)
+        if not validas.empty:
+            # Tipos nativos do Python e NULL no lugar de valores ausentes
+            linhas = validas[colunas].astype(object).where(validas[colunas].notna(), None)
+            # Pela fila de gravação, como um único comando em lote: o lote é
+            # gravado inteiro ou não é gravado, e as escritas das outras
+            # sessões entram entre um lote e outro, na ordem da fila
+            enviar_escrita(comando, list(linhas.itertuples(index=False, name=None)), em_lote=True).result()
+
+        rejeitadas = lote[motivos != ""].assign(motivo=motivos[motivos != ""])
+        yield ResultadoLote(numero, len(lote), len(validas), len(rejeitadas), time.perf_counter() - inicio), rejeitadas
+
+
+def formato_do_arquivo(nome):
+    return "parquet" if Path(nome).suffix.lower() in (".parquet", ".pq") else "csv"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Importação em lote de produtos, clientes e movimentações")
+    parser.add_argument("tabela", choices=list(ESQUEMAS_IMPORTACAO))
+    parser.add_argument("arquivo", help="arquivo CSV ou Parquet")
+    parser.add_argument("--formato", choices=["csv", "parquet"], help="padrão: pela extensão do arquivo")
+    parser.add_argument("--lote", type=int, default=TAMANHO_LOTE, help="linhas por transação")
+    parser.add_argument("--rejeitadas", help="CSV onde gravar as linhas rejeitadas e o motivo")
+    args = parser.parse_args()
+
+    init_db()
+    formato = args.formato or formato_do_arquivo(args.arquivo)
+    total_lidas = total_importadas = 0
+    cabecalho_gravado = False
+    inicio = time.perf_counter()
+    for resultado, rejeitadas in importar(args.arquivo, args.tabela, formato, args.lote):
+        total_lidas += resultado.lidas
+        total_importadas += resultado.importadas
+        print(
+            f"Lote {resultado.numero}: {resultado.importadas}/{resultado.lidas} importadas, "
+            f"{resultado.rejeitadas} rejeitadas, {resultado.linhas_por_segundo:,.0f} linhas/s"
+        )
+        if args.rejeitadas and not rejeitadas.empty:
+            rejeitadas.to_csv(
+                args.rejeitadas, mode="a" if cabecalho_gravado else "w", header=not cabecalho_gravado, encoding="utf-8"
+            )
+            cabecalho_gravado = True
+    duracao = time.perf_counter() - inicio
+    print(f"Total: {total_importadas} de {total_lidas} linhas importadas em {duracao:.1f} s.")
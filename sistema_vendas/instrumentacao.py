@@ -0,0 +1,114 @@
+import json
+import threading
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from functools import lru_cache
+
+from decouple import config
+
+
+# Comandos a partir deste tempo entram no histórico de lentas, com o plano de execução
+LIMITE_LENTA_MS = config("SISTEMA_VENDAS_CONSULTA_LENTA_MS", default=200, cast=float)
+# Arquivo JSON Lines com as consultas lentas (vazio = não grava)
+ARQUIVO_LOG = config("SISTEMA_VENDAS_LOG_CONSULTAS", default="consultas_lentas.jsonl")
+TAMANHO_HISTORICO = 100
+
+# Página em execução na sessão atual (cada sessão roda o script na sua própria thread)
+_pagina = ContextVar("pagina", default=None)
+
+
+def definir_pagina(nome):
+    _pagina.set(nome)
+
+
+def pagina_atual():
+    return _pagina.get()
+
+
+@lru_cache(maxsize=1024)
+def normalizar(query):
+    return " ".join(query.split())
+
+
+# Plano de execução como linhas indentadas pela hierarquia do EXPLAIN QUERY PLAN
+def plano_execucao(conn, query, params=None):
+    try:
+        passos = conn.execute(f"EXPLAIN QUERY PLAN {query}", params or ()).fetchall()
+    except Exception as e:
+        return [f"(plano indisponível: {e})"]
+    niveis = {0: -1}
+    linhas = []
+    for id_passo, pai, _, detalhe in passos:
+        niveis[id_passo] = niveis.get(pai, -1) + 1
+        linhas.append("  " * niveis[id_passo] + detalhe)
+    return linhas
+
+
+class Instrumentacao:
+    # Tempo e linhas de cada comando executado no banco, agregados por página e
+    # comando, e histórico circular dos comandos lentos com o plano de execução.
+    # Os parâmetros não são guardados nem gravados (podem conter dados pessoais).
+    def __init__(self, limite_ms=LIMITE_LENTA_MS, arquivo_log=ARQUIVO_LOG, tamanho_historico=TAMANHO_HISTORICO):
+        self.limite_ms = limite_ms
+        self.arquivo_log = arquivo_log
+        self._lentas = deque(maxlen=tamanho_historico)
+        self._agregados = {}
+        self._trava = threading.Lock()
+
+    # `conn` e `params` servem só para obter o plano quando o comando é lento
+    def registrar(self, query, segundos, linhas, conn=None, params=None):
+        ms = segundos * 1000
+        comando = normalizar(query)
+        pagina = pagina_atual()
+        lenta = None
+        if ms >= self.limite_ms:
+            lenta = {
+                "quando": datetime.now().isoformat(timespec="seconds"),
+                "pagina": pagina,
+                "ms": round(ms, 1),
+                "linhas": linhas,
+                "sql": comando,
+                "plano": plano_execucao(conn, query, params) if conn is not None else [],
+            }
+        with self._trava:
+            agregado = self._agregados.setdefault((pagina, comando), [0, 0.0, 0.0, 0])
+            agregado[0] += 1
+            agregado[1] += ms
+            agregado[2] = max(agregado[2], ms)
+            agregado[3] += linhas
+            if lenta:
+                self._lentas.append(lenta)
+                if self.arquivo_log:
+                    with open(self.arquivo_log, "a", encoding="utf-8") as arquivo:
+                        arquivo.write(json.dumps(lenta, ensure_ascii=False) + "\n")
+
+    # Agregados do mais custoso (tempo total) para o menos custoso
+    def resumo(self):
+        with self._trava:
+            itens = list(self._agregados.items())
+        return sorted(
+            (
+                {
+                    "pagina": pagina,
+                    "sql": comando,
+                    "execucoes": execucoes,
+                    "total_ms": round(total_ms, 1),
+                    "media_ms": round(total_ms / execucoes, 2),
+                    "max_ms": round(max_ms, 1),
+                    "linhas": linhas,
+                }
+                for (pagina, comando), (execucoes, total_ms, max_ms, linhas) in itens
+            ),
+            key=lambda item: -item["total_ms"],
+        )
+
+    # Consultas lentas, da mais recente para a mais antiga
+    def lentas(self):
+        with self._trava:
+            return list(reversed(self._lentas))
+
+    def limpar(self):
+        with self._trava:
+            self._agregados.clear()
+            self._lentas.clear()
@@ -0,0 +1,50 @@
+import importlib
+
+import streamlit as st
+
+
+# Seção da navegação -> (título, módulo de sistema_vendas.paginas, função que a
+# desenha). O nome da função é também o endereço da página na URL. Cada módulo
+# só é importado quando a página é aberta pela primeira vez no processo, então
+# plotly (Dashboard) e st_aggrid (planilhas) não pesam no login nem nas outras
+# páginas. A primeira página é a inicial.
+PAGINAS = {
+    "Cadastros": (
+        ("Cadastro de Produtos", "cadastros", "cadastrar_produto"),
+        ("Cadastro de Clientes", "cadastros", "cadastrar_cliente"),
+        ("Cadastro de Profissionais", "cadastros", "cadastrar_profissional"),
+    ),
+    "Operação": (
+        ("Estoque", "estoque", "estoque"),
+        ("Movimentações", "movimentacoes", "movimentacoes"),
+        ("Importação", "importacao", "importacao"),
+    ),
+    "Consultas": (
+        ("Produtos Cadastrados", "cadastrados", "produtos_cadastrados"),
+        ("Clientes Cadastrados", "cadastrados", "planilha_clientes"),
+        ("Dashboard", "dashboard", "dashboard"),
+    ),
+    "Sistema": (
+        ("Administração", "administracao", "administracao"),
+    ),
+}
+
+
+# Título -> endereço da página na URL
+def enderecos_paginas():
+    return {titulo: funcao for paginas in PAGINAS.values() for titulo, _, funcao in paginas}
+
+
+def _carregar(modulo, funcao):
+    def desenhar():
+        getattr(importlib.import_module(f"sistema_vendas.paginas.{modulo}"), funcao)()
+
+    return desenhar
+
+
+# Menu de páginas (st.navigation) na barra lateral; devolve a página escolhida
+def navegacao():
+    return st.navigation({
+        secao: [st.Page(_carregar(modulo, funcao), title=titulo, url_path=funcao) for titulo, modulo, funcao in paginas]
+        for secao, paginas in PAGINAS.items()
+    })
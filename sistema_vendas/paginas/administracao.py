@@ -0,0 +1,54 @@
+import pandas as pd
+import streamlit as st
+
+from sistema_vendas.banco import get_db
+
+
+# Administração: estatísticas do cache de consultas
+def administracao():
+    st.title("Administração")
+
+    st.subheader("Cache de Consultas")
+    estatisticas = get_db().cache.estatisticas()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Acertos", estatisticas["acertos"])
+    col2.metric("Falhas", estatisticas["falhas"])
+    col3.metric("Taxa de Acerto", f"{estatisticas['taxa_acerto']:.1%}")
+    col4.metric("Entradas", estatisticas["entradas"])
+    st.progress(
+        estatisticas["linhas"] / estatisticas["max_linhas"],
+        text=f"{estatisticas['linhas']} de {estatisticas['max_linhas']} linhas em cache",
+    )
+
+    df_versoes = pd.DataFrame(estatisticas["versoes"].items(), columns=["Tabela", "Versão"])
+    st.dataframe(df_versoes, hide_index=True)
+
+    if st.button("Limpar Cache"):
+        get_db().cache.invalidar()
+        st.success("Cache de consultas limpo.")
+
+    st.subheader("Consultas")
+    instrumentacao = get_db().instrumentacao
+    colunas_resumo = {
+        "pagina": "Página", "sql": "Comando", "execucoes": "Execuções", "total_ms": "Total (ms)",
+        "media_ms": "Média (ms)", "max_ms": "Máximo (ms)", "linhas": "Linhas",
+    }
+    resumo = pd.DataFrame(instrumentacao.resumo(), columns=list(colunas_resumo)).rename(columns=colunas_resumo)
+    st.caption("Comandos executados no banco desde o início do processo, do maior para o menor tempo total.")
+    st.dataframe(resumo.head(100), hide_index=True, use_container_width=True)
+
+    lentas = instrumentacao.lentas()
+    st.subheader(f"Consultas Lentas (≥ {instrumentacao.limite_ms:.0f} ms)")
+    if instrumentacao.arquivo_log:
+        st.caption(f"Também gravadas em {instrumentacao.arquivo_log}.")
+    if not lentas:
+        st.write("Nenhuma consulta lenta registrada.")
+    for lenta in lentas:
+        with st.expander(f"{lenta['ms']:.0f} ms · {lenta['pagina'] or '-'} · {lenta['quando']} · {lenta['sql'][:80]}"):
+            st.code(lenta["sql"], language="sql")
+            st.text("\n".join(lenta["plano"]) or "(sem plano)")
+            st.caption(f"{lenta['linhas']} linhas")
+
+    if st.button("Limpar Estatísticas de Consultas"):
+        instrumentacao.limpar()
+        st.rerun()
@@ -0,0 +1,138 @@
+import time
+
+import pandas as pd
+import streamlit as st
+from st_aggrid import AgGrid, GridOptionsBuilder, DataReturnMode
+
+from sistema_vendas.banco import tabela_existe
+from sistema_vendas.paginas.componentes import exportacao_sob_demanda, fragmento
+from sistema_vendas.planilhas import (
+    COLUNAS_PLANILHAS,
+    consultar_pagina_planilha,
+    contar_planilha,
+    salvar_alteracoes_planilha,
+)
+
+
+# Planilha editável paginada no servidor: filtro, ordenação e página viram
+# WHERE/ORDER BY/LIMIT no SQLite e só o bloco visível é enviado ao AgGrid
+def planilha_paginada(tabela):
+    col1, col2, col3, col4 = st.columns([3, 2, 1, 1])
+    filtro = col1.text_input("Filtrar", placeholder="Palavras ou início de palavras", key=f"{tabela}_filtro")
+    ordenar_por = col2.selectbox("Ordenar por", COLUNAS_PLANILHAS[tabela], key=f"{tabela}_ordenar_por")
+    decrescente = col3.toggle("Decrescente", key=f"{tabela}_decrescente")
+    tamanho_pagina = col4.selectbox("Linhas por página", [50, 100, 250, 500], index=1, key=f"{tabela}_tamanho")
+
+    total = contar_planilha(tabela, filtro.strip())
+    total_paginas = max(-(-total // tamanho_pagina), 1)
+    # Ajusta a página atual quando o filtro reduz o número de páginas
+    if st.session_state.get(f"{tabela}_pagina", 1) > total_paginas:
+        st.session_state[f"{tabela}_pagina"] = total_paginas
+    pagina = st.number_input(
+        f"Página (de {total_paginas}, {total} registros)",
+        min_value=1, max_value=total_paginas, step=1, key=f"{tabela}_pagina",
+    )
+
+    # O bloco carregado fica na sessão até mudar a página, o filtro ou a ordem (ou
+    # até salvar): as alterações são comparadas com o que o usuário viu, mesmo
+    # que outra sessão grave nesse meio-tempo. Cada carga monta um grid novo,
+    # porque o AgGrid editado deixa de receber dados novos.
+    identidade = (filtro.strip(), ordenar_por, decrescente, pagina, tamanho_pagina)
+    carregada = st.session_state.get(f"{tabela}_carregada")
+    if carregada is None or carregada[0] != identidade:
+        df = consultar_pagina_planilha(tabela, filtro.strip(), ordenar_por, decrescente, pagina, tamanho_pagina)
+        carga = st.session_state.get(f"{tabela}_cargas", 0) + 1
+        st.session_state[f"{tabela}_cargas"] = carga
+        st.session_state[f"{tabela}_carregada"] = (identidade, df, carga)
+    else:
+        _, df, carga = carregada
+
+    # Configurar tabela editável; ordenação e filtro ficam a cargo do servidor
+    gb = GridOptionsBuilder.from_dataframe(df)
+    gb.configure_default_column(editable=True, sortable=False, filter=False)  # Todas as colunas editáveis
+    gb.configure_selection("single")  # Permitir selecionar uma linha por vez
+    gb.configure_grid_options(domLayout='normal')
+    grid_options = gb.build()
+
+    response = AgGrid(
+        df,
+        gridOptions=grid_options,
+        data_return_mode=DataReturnMode.FILTERED_AND_SORTED,
+        update_mode='MODEL_CHANGED',
+        editable=True,
+        fit_columns_on_grid_load=True,
+        height=400,
+        key=f"{tabela}_grid_{carga}",
+    )
+    return df, response
+
+
+# Planilha e botão de salvar em um fragmento: filtrar, paginar, editar e salvar
+# reexecutam só este bloco, sem refazer o restante da página
+@fragmento
+def edicao_planilha(tabela):
+    df, response = planilha_paginada(tabela)
+
+    # Obter dados atualizados da tabela
+    updated_df = pd.DataFrame(response["data"])
+
+    # Botão para salvar as alterações
+    if st.button("Salvar Alterações", key=f"{tabela}_salvar"):
+        try:
+            # Atualizar no banco apenas as linhas que mudaram
+            inicio = time.perf_counter()
+            total_alteradas, conflitos = salvar_alteracoes_planilha(tabela, df, updated_df)
+            duracao_ms = (time.perf_counter() - inicio) * 1000
+        except Exception as e:
+            st.error(f"Erro ao salvar alterações: {e}")
+        else:
+            if conflitos:
+                st.warning(
+                    f"{len(conflitos)} linha(s) alteradas por outra sessão depois de carregadas não foram salvas "
+                    f"(id {', '.join(map(str, conflitos))}). Confira os valores atuais e edite de novo."
+                )
+            if total_alteradas:
+                st.success(f"Alterações salvas com sucesso! {total_alteradas} linha(s) em {duracao_ms:.0f} ms.")
+            elif not conflitos:
+                st.info("Nenhuma alteração para salvar.")
+            if total_alteradas or conflitos:
+                # Próxima execução recarrega o bloco do banco
+                st.session_state.pop(f"{tabela}_carregada", None)
+
+
+# Produtos cadastrados
+def produtos_cadastrados():
+    # Verificar se a tabela `produtos` existe
+    if not tabela_existe("produtos"):
+        st.error("A tabela `produtos` não foi encontrada no banco de dados. Verifique a estrutura do banco.")
+        return
+
+    # Título e descrição
+    st.title("Gerenciamento de Produtos")
+    st.write("Visualize e edite os dados dos clientes cadastrados no sistema. As alterações serão salvas no banco de dados.")
+
+    # Renderizar tabela editável com apenas a página atual
+    edicao_planilha("produtos")
+
+    # Exportar a tabela completa
+    st.subheader("Exportar")
+    exportacao_sob_demanda("produtos", "Produtos")
+
+
+# Planilha de clientes
+def planilha_clientes():
+    # Verificar se a tabela `clientes` existe
+    if not tabela_existe("clientes"):
+        st.error("A tabela `clientes` não foi encontrada no banco de dados. Verifique a estrutura do banco.")
+        return
+
+    # Título e descrição
+    st.title("Gerenciamento de Clientes")
+    st.write("Visualize e edite os dados dos clientes cadastrados no sistema. As alterações serão salvas no banco de dados.")
+
+    # Renderizar tabela editável com apenas a página atual
+    edicao_planilha("clientes")
+
+    # Exportar a tabela completa
+    st.subheader("Exportar")
+    exportacao_sob_demanda("clientes", "Clientes")
@@ -0,0 +1,119 @@
+import sqlite3
+from datetime import datetime
+
+import streamlit as st
+
+from sistema_vendas.banco import execute_query
+
+
+# Funções de manipulação de produtos
+def cadastrar_produto():
+    st.title("Cadastro de Produtos")
+    with st.form("product_form", clear_on_submit=True):
+        nome_produto = st.text_input("Nome do Produto", placeholder="Digite o nome do produto")
+        marca = st.text_input("Marca", placeholder="Digite a marca do produto")
+        tamanho = st.text_input("Tamanho", placeholder="Digite o tamanho ou especificação")
+        preco_compra = st.number_input("Preço de Compra", min_value=0.01, step=0.01, format="%.2f")
+        preco_venda = st.number_input("Preço de Venda", min_value=0.01, step=0.01, format="%.2f")
+        data_compra = st.date_input("Data da Compra")
+
+        # Botão para submeter o formulário
+        if st.form_submit_button("Cadastrar"):
+            # Validação de campos obrigatórios
+            if not (nome_produto and marca and tamanho and preco_compra > 0 and preco_venda > 0 and data_compra):
+                st.error("Todos os campos são obrigatórios! Por favor, preencha todos os campos.")
+            else:
+                # Comando SQL para inserir o produto no banco de dados
+                query = """
+                INSERT INTO produtos (nome, marca, tamanho, preco_compra, preco_venda, data_compra)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """
+                params = (
+                    nome_produto,
+                    marca,
+                    tamanho,
+                    preco_compra,
+                    preco_venda,
+                    data_compra.strftime("%Y-%m-%d")
+                )
+                try:
+                    execute_query(query, params)
+                    st.success(f"Produto '{nome_produto}' cadastrado com sucesso!")
+                except sqlite3.Error as e:
+                    st.error(f"Erro ao cadastrar o produto: {e}")
+
+
+# Função para cadastro de clientes
+def cadastrar_cliente():
+    st.title("Cadastro de Clientes")
+    with st.form("client_form", clear_on_submit=True):
+        nome_completo = st.text_input("Nome Completo", placeholder="Digite o nome completo do cliente")
+        cpf = st.text_input("CPF", placeholder="Digite o CPF do cliente (apenas números)")
+        endereco = st.text_area("Endereço Completo", placeholder="Digite o endereço completo")
+        email = st.text_input("E-mail", placeholder="Digite o e-mail do cliente")
+        telefone = st.text_input("Número de Telefone", placeholder="Digite o número de telefone")
+        data_nascimento = st.date_input("Data de Nascimento")
+        data_cadastro = datetime.today().strftime("%Y-%m-%d")  # Data de cadastro automática
+
+        st.write(f"Data de Cadastro: {data_cadastro}")
+
+        # Botão para submeter o formulário
+        if st.form_submit_button("Cadastrar"):
+            # Validação de campos obrigatórios
+            if not (nome_completo and cpf and endereco and email and telefone and data_nascimento):
+                st.error("Todos os campos são obrigatórios! Por favor, preencha todos os campos.")
+            else:
+                # Comando SQL para inserir o cliente no banco de dados
+                query = """
+                INSERT INTO clientes (nome, cpf, endereco, email, telefone, data_nascimento, data_cadastro)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """
+                params = (
+                    nome_completo,
+                    cpf,
+                    endereco,
+                    email,
+                    telefone,
+                    data_nascimento.strftime("%Y-%m-%d"),
+                    data_cadastro
+                )
+                try:
+                    execute_query(query, params)
+                    st.success(f"Cliente '{nome_completo}' cadastrado com sucesso!")
+                except sqlite3.Error as e:
+                    st.error(f"Erro ao cadastrar o cliente: {e}")
+
+
+# Cadastro de profissionais
+def cadastrar_profissional():
+    st.title("Cadastro de Profissionais")
+
+    with st.form("professional_form", clear_on_submit=True):
+        nome = st.text_input("Nome Completo", placeholder="Digite o nome completo")
+        genero = st.selectbox("Selecione um Gênero:", ["Masculino", "Feminino"])
+        area_atuacao = st.text_input("Área de Atuação", placeholder="Digite a área de atuação")
+        cpf = st.text_input("CPF", placeholder="Digite o CPF")
+        telefone = st.text_input("Número de Telefone", placeholder="Digite o número de telefone")
+        data_nascimento = st.date_input("Data de Nascimento")
+        endereco = st.text_area("Endereço", placeholder="Digite o endereço")
+        observacao = st.text_area("Observação (opcional)")
+        data_cadastro = datetime.today().strftime("%Y-%m-%d")
+
+        if st.form_submit_button("Cadastrar"):
+            if not (nome and genero and area_atuacao and cpf and telefone and data_nascimento and endereco):
+                st.error("Todos os campos são obrigatórios, exceto Observação!")
+            else:
+                query = """
+                INSERT INTO profissionais (nome, genero, area_atuacao, cpf, telefone, data_nascimento, endereco, observacao, data_cadastro)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """
+                # Corrigindo o uso de `strftime` para `data_nascimento`
+                params = (nome, genero, area_atuacao, cpf, telefone, data_nascimento, endereco, observacao, data_cadastro)
+
+                try:
+                    execute_query(query, params)
+                    st.success("Profissional cadastrado com sucesso!")
+                except sqlite3.IntegrityError:
+                    st.error("Erro: CPF já cadastrado.")
+                except sqlite3.Error as e:
+                    st.error(f"Erro ao cadastrar o profissional: {e}")
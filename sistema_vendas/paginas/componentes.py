@@ -0,0 +1,51 @@
+import tempfile
+from functools import wraps
+
+import streamlit as st
+
+from sistema_vendas.exportacao import (
+    FORMATOS_EXPORTACAO,
+    LIMITE_EXPORTACAO_TELA,
+    LimiteExportacaoExcedido,
+    exportar,
+)
+from sistema_vendas.instrumentacao import definir_pagina
+
+
+# st.fragment para as páginas: interagir com um fragmento reexecuta só ele, sem
+# o script principal. Por isso a página das consultas medidas é restaurada da
+# sessão (o script principal a guarda em st.session_state["pagina"]).
+def fragmento(funcao):
+    @wraps(funcao)
+    def executar(*args, **kwargs):
+        definir_pagina(st.session_state.get("pagina"))
+        return funcao(*args, **kwargs)
+
+    return st.fragment(executar)
+
+
+# Exportação gerada só quando pedida, lendo a tabela em lotes, em vez de
+# materializar a tabela inteira a cada rerun; gerar e baixar reexecutam só este
+# bloco. O st.download_button guarda o arquivo pronto em memória, por isso a
+# tela exporta no máximo LIMITE_EXPORTACAO_TELA linhas e indica a linha de
+# comando para tabelas maiores.
+@fragmento
+def exportacao_sob_demanda(tabela, rotulo):
+    col1, col2 = st.columns([1, 3])
+    formato = col1.selectbox("Formato", list(FORMATOS_EXPORTACAO), key=f"{tabela}_formato_exportacao")
+    if col2.button(f"Gerar Planilha de {rotulo}", key=f"{tabela}_gerar_exportacao"):
+        extensao, mime = FORMATOS_EXPORTACAO[formato]
+        with st.spinner("Gerando arquivo..."), tempfile.TemporaryFile() as arquivo:
+            try:
+                total = exportar(tabela, formato, arquivo, limite=LIMITE_EXPORTACAO_TELA)
+            except LimiteExportacaoExcedido as e:
+                st.warning(f"Planilha grande demais para baixar pela tela: {e}")
+                return
+            arquivo.seek(0)
+            st.download_button(
+                label=f"Baixar Planilha de {rotulo} ({total} linhas)",
+                data=arquivo.read(),
+                file_name=f"{tabela}{extensao}",
+                mime=mime,
+                key=f"{tabela}_baixar_exportacao",
+            )
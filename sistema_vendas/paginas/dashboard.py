@@ -0,0 +1,151 @@
+import time
+from datetime import datetime, timedelta
+
+import plotly.express as px
+import streamlit as st
+
+from sistema_vendas.analitico import MOTOR_ANALITICO
+from sistema_vendas.banco import CONSULTAS_PARALELAS, consultar_em_paralelo
+from sistema_vendas.consultas import (
+    GRANULARIDADES,
+    consultar_custos_periodo,
+    consultar_indicadores,
+    consultar_vendas_periodo,
+    consultar_vendas_por_marca,
+    consultar_vendas_por_tamanho,
+)
+from sistema_vendas.graficos import PONTOS_GRAFICO, lttb, posicoes_periodo
+from sistema_vendas.paginas.componentes import fragmento
+
+
+# Consultas do painel, independentes entre si (disparadas ao mesmo tempo):
+# nome -> (função, se recebe a granularidade, ou seja, se é uma série no tempo)
+CONSULTAS = {
+    "indicadores": (consultar_indicadores, False),
+    "vendas_periodo": (consultar_vendas_periodo, True),
+    "custos_periodo": (consultar_custos_periodo, True),
+    "vendas_por_marca": (consultar_vendas_por_marca, False),
+    "vendas_por_tamanho": (consultar_vendas_por_tamanho, False),
+}
+
+# Gráficos na ordem de exibição: (consulta, tipo do plotly.express, x, y, título, opções).
+# Vendas e faturamento por período vêm da mesma consulta.
+GRAFICOS = (
+    ("vendas_periodo", "bar", "Período", "Total de Vendas", "Total de Vendas por {granularidade}", {}),
+    ("custos_periodo", "bar", "Período", "Total de Custos", "Total de Custos por {granularidade}", {}),
+    ("vendas_por_marca", "bar", "Marca", "Total de Vendas", "Vendas por Marca", {"barmode": "stack"}),
+    ("vendas_por_tamanho", "bar", "Tamanho", "Total de Vendas", "Vendas por Tamanho", {"barmode": "stack"}),
+    ("vendas_periodo", "line", "Período", "Faturamento", "Faturamento por {granularidade}", {}),
+)
+
+
+# Figuras guardadas pelo hash dos dados agregados: reruns com os mesmos dados não
+# refazem o plotly.express (dezenas de ms por gráfico). cache_resource devolve a
+# mesma figura, sem a cópia por pickle do cache_data; st.plotly_chart não a altera.
+@st.cache_resource(max_entries=100, show_spinner=False)
+def figura(df, tipo, x, y, titulo, opcoes):
+    return getattr(px, tipo)(df, x=x, y=y, title=titulo, **opcoes)
+
+
+# Cada gráfico é um fragmento com a sua própria consulta: pode ser redesenhado
+# sozinho, sem refazer os indicadores nem os demais gráficos. Dentro do painel a
+# consulta já foi feita em paralelo e o resultado vem do cache de consultas.
+# Séries longas (por dia em um intervalo grande) são reduzidas com LTTB.
+@fragmento
+def grafico(consulta, args, serie, tipo, x, y, titulo, opcoes):
+    df = consulta(*args)
+    total = len(df)
+    if serie and total > PONTOS_GRAFICO:
+        df = df.iloc[lttb(posicoes_periodo(df[x]), df[y], PONTOS_GRAFICO)].reset_index(drop=True)
+    st.plotly_chart(figura(df, tipo, x, y, titulo, opcoes), use_container_width=True)
+    if len(df) < total:
+        st.caption(f"{len(df)} de {total} pontos exibidos (redução LTTB).")
+
+
+# Função principal do Dashboard
+def dashboard():
+    st.title("Dashboard de Indicadores")
+    painel()
+
+
+# Função para criar cartões estilizados
+def create_card(title, value, color="#1f77b4"):
+    return f"""
+    <div style="background-color:{color}; padding:20px; border-radius:15px; text-align:center; box-shadow:0 4px 6px rgba(0, 0, 0, 0.1); margin-bottom:20px;">
+        <h3 style="color:white; font-size:22px; margin-bottom:10px;">{title}</h3>
+        <p style="font-size:28px; font-weight:bold; color:white;">{value}</p>
+    </div>"""
+
+
+# Exibição de Indicadores
+def exibir_indicadores(indicadores):
+    total_faturamento = indicadores.total_faturamento
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown(create_card("Produtos Cadastrados", indicadores.total_produtos, "#1f77b4"), unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(create_card("Clientes Cadastrados", indicadores.total_clientes, "#1f77b4"), unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(create_card("Profissionais Cadastrados", indicadores.total_profissionais, "#1f77b4"), unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(create_card("Faturamento Total", f"R$ {total_faturamento:.2f}" if total_faturamento else "R$ 0,00", "#1f77b4"), unsafe_allow_html=True)
+
+    col5, col6 = st.columns(2)
+    with col5:
+        st.markdown(create_card("Total de Produtos Vendidos", indicadores.total_produtos_vendidos, "#1f77b4"), unsafe_allow_html=True)
+    with col6:
+        st.markdown(create_card("Total de Produtos Comprados", indicadores.total_produtos_comprados, "#1f77b4"), unsafe_allow_html=True)
+
+
+# Período, indicadores e gráficos em um fragmento: mudar as datas reexecuta só
+# o painel, sem a navegação e a busca da barra lateral (fragmentos não escrevem
+# na barra lateral, por isso o filtro fica no topo da página)
+@fragmento
+def painel():
+    # Filtro por período e agrupamento das séries (feito no SQL)
+    col_inicio, col_fim, col_granularidade = st.columns(3)
+    data_inicio = col_inicio.date_input("Data Início", datetime.now() - timedelta(days=30), key="dashboard_inicio")
+    data_fim = col_fim.date_input("Data Fim", datetime.now(), key="dashboard_fim")
+    granularidade = col_granularidade.selectbox(
+        "Agrupar por", list(GRANULARIDADES), index=list(GRANULARIDADES).index("Mês"), key="dashboard_granularidade"
+    )
+
+    if data_inicio > data_fim:
+        st.error("A data inicial não pode ser posterior à data final.")
+        return
+
+    # Convertendo para string no formato de banco de dados
+    periodo = (data_inicio.strftime("%Y-%m-%d"), data_fim.strftime("%Y-%m-%d"))
+
+    # Espaços reservados na ordem de exibição: as consultas (indicadores e
+    # gráficos, lidos do resumo diário `vendas_diarias`) são disparadas todas de
+    # uma vez e cada parte é desenhada assim que a sua consulta termina
+    espaco_indicadores = st.container()
+    espacos_graficos = [st.container() for _ in GRAFICOS]
+    argumentos = {
+        nome: periodo + (granularidade,) if serie else periodo for nome, (_, serie) in CONSULTAS.items()
+    }
+    inicio = time.perf_counter()
+    tempos = {}
+    for nome, resultado, segundos in consultar_em_paralelo(
+        {nome: (consulta, argumentos[nome]) for nome, (consulta, _) in CONSULTAS.items()}
+    ):
+        tempos[nome] = segundos * 1000
+        if nome == "indicadores":
+            with espaco_indicadores:
+                exibir_indicadores(resultado)
+        for espaco, (consulta, tipo, x, y, titulo, opcoes) in zip(espacos_graficos, GRAFICOS):
+            if consulta == nome:
+                funcao, serie = CONSULTAS[consulta]
+                with espaco:
+                    grafico(funcao, argumentos[consulta], serie, tipo, x, y,
+                            titulo.format(granularidade=granularidade), opcoes)
+
+    modo = f"{CONSULTAS_PARALELAS} threads" if CONSULTAS_PARALELAS > 1 else "em sequência"
+    st.caption(
+        f"Consultas do painel ({modo}, {MOTOR_ANALITICO}) em {(time.perf_counter() - inicio) * 1000:.0f} ms: "
+        + " · ".join(f"{nome} {ms:.0f} ms" for nome, ms in tempos.items())
+    )
@@ -0,0 +1,18 @@
+import streamlit as st
+
+from sistema_vendas.consultas import consultar_estoque
+
+
+# Estoque de produtos
+def estoque():
+    st.title("Estoque de Produtos")
+
+    estoque_atual = consultar_estoque()
+
+    if estoque_atual.num_rows:
+        # Exibir os produtos em estoque
+        st.dataframe(estoque_atual.rename_columns([
+            "ID Produto", "Nome", "Marca", "Tamanho", "Preço Compra", "Preço Venda", "Saldo"
+        ]))
+    else:
+        st.write("Nenhum produto em estoque no momento.")
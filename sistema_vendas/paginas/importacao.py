@@ -0,0 +1,53 @@
+import pandas as pd
+import streamlit as st
+
+from sistema_vendas.importacao import ESQUEMAS_IMPORTACAO, TAMANHO_LOTE, formato_do_arquivo, importar
+
+
+# Importação em lote de arquivos CSV ou Parquet
+def importacao():
+    st.title("Importação de Dados")
+    st.write("Importe produtos, clientes ou movimentações a partir de arquivos CSV ou Parquet.")
+
+    nomes_tabelas = {"Produtos": "produtos", "Clientes": "clientes", "Movimentações": "movimentacoes"}
+    tabela = nomes_tabelas[st.selectbox("Tipo de dado", list(nomes_tabelas))]
+    st.caption("Colunas esperadas: " + ", ".join(
+        f"{coluna}{'' if obrigatoria else ' (opcional)'}"
+        for coluna, (_, obrigatoria) in ESQUEMAS_IMPORTACAO[tabela].items()
+    ))
+    arquivo = st.file_uploader("Arquivo", type=["csv", "parquet"])
+    tamanho_lote = st.number_input("Linhas por lote", min_value=100, max_value=100_000, value=TAMANHO_LOTE, step=1000)
+
+    if arquivo is None or not st.button("Importar"):
+        return
+
+    resumo = st.empty()
+    resultados, rejeitadas = [], []
+    with st.spinner("Importando..."):
+        try:
+            for resultado, rejeitadas_lote in importar(arquivo, tabela, formato_do_arquivo(arquivo.name), tamanho_lote):
+                resultados.append({
+                    "Lote": resultado.numero,
+                    "Lidas": resultado.lidas,
+                    "Importadas": resultado.importadas,
+                    "Rejeitadas": resultado.rejeitadas,
+                    "Linhas/s": round(resultado.linhas_por_segundo),
+                })
+                rejeitadas.append(rejeitadas_lote)
+                resumo.dataframe(pd.DataFrame(resultados), hide_index=True)
+        except Exception as e:
+            st.error(f"Erro ao importar o arquivo: {e}")
+            return
+
+    total_importadas = sum(resultado["Importadas"] for resultado in resultados)
+    st.success(f"{total_importadas} registro(s) importado(s).")
+    df_rejeitadas = pd.concat(rejeitadas) if rejeitadas else pd.DataFrame()
+    if not df_rejeitadas.empty:
+        st.warning(f"{len(df_rejeitadas)} linha(s) rejeitada(s).")
+        st.dataframe(df_rejeitadas.head(1000))
+        st.download_button(
+            label="Baixar Linhas Rejeitadas",
+            data=df_rejeitadas.to_csv().encode("utf-8"),
+            file_name=f"{tabela}_rejeitadas.csv",
+            mime="text/csv",
+        )
@@ -0,0 +1,145 @@
+import sqlite3
+from datetime import datetime
+
+import streamlit as st
+
+from sistema_vendas.banco import execute_query
+from sistema_vendas.consultas import (
+    FiltrosHistorico,
+    buscar_clientes,
+    buscar_produtos,
+    buscar_profissionais,
+    consultar_historico,
+    contar_historico,
+)
+from sistema_vendas.paginas.componentes import exportacao_sob_demanda, fragmento
+
+
+# Seletor com busca: o texto digitado filtra no banco e só as primeiras
+# ocorrências viram opções. Devolve o valor da opção escolhida ou None.
+def seletor_com_busca(rotulo, buscar, chave, vazio):
+    col_busca, col_opcao = st.columns([1, 2])
+    texto = col_busca.text_input(f"Buscar {rotulo}", placeholder="Início do nome", key=f"{chave}_busca").strip()
+    opcoes = buscar(texto)
+    if not opcoes:
+        col_opcao.warning(vazio if not texto else f"Nenhum resultado para \"{texto}\".")
+        return None
+    opcao = col_opcao.selectbox(rotulo, opcoes, format_func=lambda opcao: opcao[1], key=chave)
+    return opcao[0]
+
+
+def movimentacoes():
+    st.title("Movimentações de Produtos")
+    formulario_movimentacao()
+
+    # Exibir histórico de movimentações
+    historico_movimentacoes()
+
+
+# Formulário de registro: buscar e escolher opções reexecuta só este fragmento,
+# sem refazer a consulta do histórico
+@fragmento
+def formulario_movimentacao():
+    # Seletores fora do formulário para que a busca atualize as opções a cada tecla
+    id_produto_selecionado = seletor_com_busca(
+        "Produto", buscar_produtos, "movimentacao_produto",
+        "Nenhum produto cadastrado. Por favor, cadastre produtos antes de registrar movimentações.",
+    )
+    tipo = st.selectbox("Tipo de Movimentação", ["Venda", "Compra"], key="movimentacao_tipo")
+
+    # Seleção de profissional responsável
+    profissional = seletor_com_busca(
+        "Profissional Responsável", buscar_profissionais, "movimentacao_profissional",
+        "Nenhum profissional cadastrado. Cadastre um antes de prosseguir.",
+    )
+
+    # Seleção de cliente (somente para vendas)
+    cliente = None
+    if tipo == "Venda":
+        cliente = seletor_com_busca(
+            "Cliente", buscar_clientes, "movimentacao_cliente",
+            "Nenhum cliente cadastrado. Cadastre um antes de prosseguir.",
+        )
+
+    with st.form("movement_form", clear_on_submit=True):
+        quantidade = st.number_input("Quantidade", min_value=1)
+        data = st.date_input("Data", value=datetime.today())
+
+        if st.form_submit_button("Registrar Movimentação"):
+            if id_produto_selecionado and profissional and (tipo != "Venda" or cliente):
+                try:
+                    execute_query("""
+                        INSERT INTO movimentacoes (id_produto, tipo, quantidade, profissional, cliente, data)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                    """, (id_produto_selecionado, tipo, quantidade, profissional, cliente if cliente else None,
+                          data.strftime("%Y-%m-%d")))
+                except sqlite3.Error as e:
+                    st.error(f"Erro ao registrar a movimentação: {e}")
+                else:
+                    # O histórico está em outro fragmento: só uma execução completa o atualiza
+                    st.session_state["movimentacao_registrada"] = True
+                    st.rerun()
+            else:
+                st.error("Por favor, selecione todos os campos obrigatórios.")
+
+    if st.session_state.pop("movimentacao_registrada", False):
+        st.success("Movimentação registrada com sucesso!")
+
+
+# Histórico paginado: filtros aplicados no SQL e paginação por chave (id).
+# Filtros e paginação reexecutam só este fragmento.
+@fragmento
+def historico_movimentacoes():
+    st.subheader("Histórico de Movimentações")
+
+    col1, col2, col3, col4 = st.columns(4)
+    id_produto = col1.number_input("ID do Produto (0 = todos)", min_value=0, step=1, key="historico_produto")
+    tipo = col2.selectbox("Tipo", ["Todos", "Venda", "Compra"], key="historico_tipo")
+    periodo = col3.date_input("Período", value=(), key="historico_periodo")
+    profissional = col4.text_input("Profissional", placeholder="Início do nome", key="historico_profissional")
+    tamanho_pagina = st.selectbox("Movimentações por página", [25, 50, 100, 250], index=1, key="historico_tamanho")
+
+    filtros = FiltrosHistorico(
+        id_produto=id_produto or None,
+        tipo=None if tipo == "Todos" else tipo,
+        data_inicio=periodo[0].strftime("%Y-%m-%d") if len(periodo) == 2 else None,
+        data_fim=periodo[1].strftime("%Y-%m-%d") if len(periodo) == 2 else None,
+        profissional=profissional.strip() or None,
+    )
+
+    # Pilha com o id inicial de cada página visitada; volta à primeira página (e
+    # desliga a contagem) quando os filtros mudam
+    if st.session_state.get("historico_filtros") != (filtros, tamanho_pagina):
+        st.session_state["historico_filtros"] = (filtros, tamanho_pagina)
+        st.session_state["historico_paginas"] = [None]
+        st.session_state["historico_contar"] = False
+    paginas = st.session_state["historico_paginas"]
+
+    historico, tem_proxima = consultar_historico(filtros, paginas[-1], tamanho_pagina)
+    # Sem filtros o total vem da contagem mantida pelos gatilhos; com filtros só é
+    # contado quando pedido, e até lá a página mostra quantas já foram percorridas
+    filtrado = filtros != FiltrosHistorico()
+    total = contar_historico(filtros) if not filtrado or st.session_state["historico_contar"] else None
+
+    if historico.num_rows:
+        st.dataframe(historico.rename_columns([
+            "ID", "ID Produto", "Tipo", "Quantidade", "Profissional", "Cliente", "Data"
+        ]), hide_index=True)
+    else:
+        st.write("Nenhuma movimentação registrada.")
+
+    # A troca de página acontece no callback, antes da reexecução do fragmento
+    col_anterior, col_info, col_proxima = st.columns([1, 2, 1])
+    col_anterior.button("◀ Anterior", disabled=len(paginas) == 1, key="historico_anterior", on_click=paginas.pop)
+    if total is not None:
+        col_info.write(f"Página {len(paginas)} de {max(-(-total // tamanho_pagina), 1)} — {total} movimentações")
+    else:
+        vistas = (len(paginas) - 1) * tamanho_pagina + historico.num_rows
+        col_info.write(f"Página {len(paginas)} — {vistas}{'+' if tem_proxima else ''} movimentações")
+        col_info.button("Contar resultados", key="historico_contar_botao",
+                        on_click=st.session_state.__setitem__, args=("historico_contar", True))
+    col_proxima.button("Próxima ▶", disabled=not tem_proxima, key="historico_proxima",
+                       on_click=paginas.append, args=(historico["id"][-1].as_py() if tem_proxima else None,))
+
+    # Exportar o histórico completo
+    exportacao_sob_demanda("movimentacoes", "Movimentações")
@@ -0,0 +1,123 @@
+import pandas as pd
+
+from sistema_vendas.banco import enviar_escrita, execute_query, read_dataframe
+from sistema_vendas.busca import condicao_busca, expressao_busca
+
+
+# Colunas das planilhas editáveis; servem também como lista permitida para ORDER BY
+COLUNAS_PLANILHAS = {
+    "produtos": ("id", "nome", "marca", "tamanho", "preco_compra", "preco_venda", "data_compra"),
+    "clientes": ("id", "nome", "cpf", "endereco", "email", "telefone", "data_nascimento", "data_cadastro"),
+}
+# Colunas REAL/INTEGER das planilhas: o grid devolve texto, convertido antes de gravar
+COLUNAS_NUMERICAS = {
+    "produtos": ("preco_compra", "preco_venda"),
+    "clientes": (),
+}
+
+
+# Filtro pelo índice de busca textual: cada palavra digitada deve iniciar
+# alguma palavra de nome, marca, CPF, e-mail etc.
+def _filtro_planilha(tabela, filtro):
+    expressao = expressao_busca(filtro)
+    if expressao is None:
+        return "", []
+    return f"WHERE {condicao_busca(tabela)}", [expressao]
+
+
+# Bloco de linhas de uma planilha com filtro, ordenação e paginação feitos no SQLite
+def consultar_pagina_planilha(tabela, filtro=None, ordenar_por="id", decrescente=False, pagina=1, tamanho_pagina=100):
+    colunas = COLUNAS_PLANILHAS[tabela]
+    if ordenar_por not in colunas:
+        raise ValueError(f"Coluna inválida para ordenação: {ordenar_por}")
+    where, params = _filtro_planilha(tabela, filtro)
+    direcao = "DESC" if decrescente else "ASC"
+    return read_dataframe(f"""
+        SELECT {", ".join(colunas)}
+        FROM {tabela}
+        {where}
+        ORDER BY {ordenar_por} {direcao}, id {direcao}
+        LIMIT ? OFFSET ?
+    """, (*params, tamanho_pagina, (pagina - 1) * tamanho_pagina))
+
+
+def contar_planilha(tabela, filtro=None):
+    where, params = _filtro_planilha(tabela, filtro)
+    return execute_query(f"SELECT COUNT(*) FROM {tabela} {where}", params, fetch=True)[0][0]
+
+
+# Linhas do resultado do AgGrid que diferem do bloco carregado do banco (comparadas pelo id)
+def linhas_alteradas(original, atualizado, colunas):
+    if atualizado.empty:
+        return atualizado
+    atualizado = atualizado.assign(id=pd.to_numeric(atualizado["id"], errors="coerce")).dropna(subset=["id"])
+    antes = original.set_index("id")[colunas]
+    depois = atualizado.astype({"id": "int64"}).set_index("id")[colunas]
+    depois = depois[depois.index.isin(antes.index)]
+    antes = antes.loc[depois.index]
+    # Valores iguais, ambos vazios, ou iguais como texto (o grid pode devolver outro tipo)
+    iguais = (antes == depois) | (antes.isna() & depois.isna()) | (antes.astype(str) == depois.astype(str))
+    return depois[~iguais.all(axis=1)]
+
+
+# Número a partir do texto digitado, aceitando vírgula decimal ("12,5"); vazio ou
+# texto que não é número vira NaN. Usado também pela importação em lote.
+def texto_para_numero(valores):
+    texto = valores.astype(str).str.strip().str.replace(",", ".", regex=False)
+    return pd.to_numeric(texto.where(valores.notna() & (texto != "")), errors="coerce")
+
+
+# Converte as colunas numéricas editadas. Um texto que não é número gera
+# ValueError em vez de ser gravado numa coluna REAL/INTEGER.
+def _converter_numeros(tabela, alteradas):
+    alteradas = alteradas.copy()
+    for coluna in COLUNAS_NUMERICAS[tabela]:
+        valores = alteradas[coluna]
+        numeros = texto_para_numero(valores)
+        invalidos = valores.notna() & (valores.astype(str).str.strip() != "") & numeros.isna()
+        if invalidos.any():
+            ids = ", ".join(str(id_linha) for id_linha in alteradas.index[invalidos])
+            raise ValueError(f"Valor não numérico em {coluna} (id {ids}).")
+        alteradas[coluna] = numeros
+    return alteradas
+
+
+# Tipos nativos do Python (o sqlite3 não aceita escalares do numpy) e NaN como NULL
+def _valores_sql(df):
+    return df.astype(object).where(df.notna(), None)
+
+
+# Grava apenas as linhas alteradas em relação a `original` (o bloco que o usuário
+# carregou), em uma única transação. Cada UPDATE só vale se a linha no banco
+# ainda tem os valores de `original`; linhas alteradas por outra sessão nesse
+# meio-tempo não são sobrescritas. Devolve (linhas salvas, ids em conflito).
+def salvar_alteracoes_planilha(tabela, original, atualizado):
+    colunas = [coluna for coluna in COLUNAS_PLANILHAS[tabela] if coluna != "id"]
+    alteradas = linhas_alteradas(original, atualizado, colunas)
+    if alteradas.empty:
+        return 0, []
+    novos = _valores_sql(_converter_numeros(tabela, alteradas))
+    antigos = _valores_sql(original.set_index("id").loc[alteradas.index, colunas])
+    params = [
+        (*novo, int(id_linha), *antigo)
+        for id_linha, novo, antigo in zip(novos.index, novos.itertuples(index=False), antigos.itertuples(index=False))
+    ]
+    atribuicoes = ", ".join(f"{coluna} = ?" for coluna in colunas)
+    # IS compara também valores NULL
+    condicoes = " AND ".join(f"{coluna} IS ?" for coluna in colunas)
+    # Pela fila de gravação, como um único comando em lote
+    salvas = enviar_escrita(
+        f"UPDATE {tabela} SET {atribuicoes} WHERE id = ? AND {condicoes}", params, em_lote=True
+    ).result()
+    conflitos = []
+    if salvas < len(params):
+        # Linhas que não ficaram com os valores enviados: outra sessão as alterou antes
+        ids = [int(id_linha) for id_linha in novos.index]
+        marcadores = ", ".join("?" * len(ids))
+        atuais = read_dataframe(
+            f"SELECT id, {', '.join(colunas)} FROM {tabela} WHERE id IN ({marcadores})", ids
+        ).set_index("id")
+        for id_linha, novo in zip(ids, novos.itertuples(index=False)):
+            if id_linha not in atuais.index or tuple(_valores_sql(atuais.loc[[id_linha]]).iloc[0]) != tuple(novo):
+                conflitos.append(id_linha)
+    return salvas, conflitos
@@ -0,0 +1,23 @@
+import os
+import tempfile
+
+import pytest
+
+
+# O banco e o log vêm da configuração lida na importação de sistema_vendas:
+# os testes usam um banco temporário e não gravam o log de consultas lentas
+os.environ["SISTEMA_VENDAS_DB"] = os.path.join(tempfile.mkdtemp(prefix="sistema_vendas_"), "testes.db")
+os.environ["SISTEMA_VENDAS_LOG_CONSULTAS"] = ""
+
+# Banco pequeno gerado uma vez por execução dos testes
+QUANTIDADES = {"produtos": 200, "clientes": 500, "profissionais": 5, "movimentacoes": 5000}
+PERIODO = ("2024-01-01", "2024-06-30")
+
+
+@pytest.fixture(scope="session")
+def banco():
+    from sistema_vendas import gerador
+    from sistema_vendas.banco import get_db
+
+    gerador.gerar(QUANTIDADES, dias=365)
+    return get_db()
@@ -0,0 +1,38 @@
+import pytest
+
+from conftest import PERIODO
+
+pytest.importorskip("duckdb")
+
+from sistema_vendas import consultas  # noqa: E402
+from sistema_vendas.analitico import ATUALIZACAO_DUCKDB_S, comparar_motores, get_motor  # noqa: E402
+from sistema_vendas.banco import execute_query  # noqa: E402
+
+TUDO = ("0000-01-01", "9999-12-31")
+
+
+@pytest.mark.parametrize("periodo", [PERIODO, TUDO], ids=["semestre", "tudo"])
+def test_duckdb_devolve_o_mesmo_que_o_sqlite(banco, periodo):
+    assert comparar_motores(*periodo) == []
+
+
+def test_duckdb_usa_a_copia_anterior_dentro_do_intervalo(banco):
+    motor = get_motor()
+    antes = consultas.consultar_indicadores(*TUDO, motor="duckdb").total_produtos_vendidos
+    execute_query("""
+        INSERT INTO movimentacoes (id_produto, tipo, quantidade, profissional, cliente, data)
+        VALUES (1, 'Venda', 7, 'Teste', NULL, ?)
+    """, (PERIODO[0],))
+    # Cópia feita há menos de ATUALIZACAO_DUCKDB_S segundos: não é refeita
+    assert consultas.consultar_indicadores(*TUDO, motor="duckdb").total_produtos_vendidos == antes
+
+    motor.intervalo_s = 0
+    try:
+        # Esta consulta ainda lê a cópia anterior e dispara a nova em segundo plano
+        assert consultas.consultar_indicadores(*TUDO, motor="duckdb").total_produtos_vendidos == antes
+        with motor._trava:
+            pass
+        assert consultas.consultar_indicadores(*TUDO, motor="duckdb").total_produtos_vendidos == antes + 7
+    finally:
+        motor.intervalo_s = ATUALIZACAO_DUCKDB_S
+    assert comparar_motores(*TUDO) == []
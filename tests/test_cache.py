@@ -0,0 +1,45 @@
+import sqlite3
+
+from conftest import PERIODO
+from sistema_vendas import consultas
+from sistema_vendas.banco import DB_NAME, execute_query, init_db
+
+
+def test_init_db_nao_descarta_o_cache(banco):
+    consultas.consultar_indicadores(*PERIODO)
+    entradas = banco.cache.estatisticas()["entradas"]
+    assert entradas
+    # A tela de login chama init_db() a cada rerun
+    init_db()
+    init_db()
+    assert banco.cache.estatisticas()["entradas"] == entradas
+
+
+def test_escrita_de_outro_processo_invalida_o_cache(banco):
+    antes = consultas.consultar_indicadores(*PERIODO)
+    assert consultas.consultar_indicadores(*PERIODO) == antes  # do cache
+    # Outra conexão, como a importação pela linha de comando em outro processo
+    externa = sqlite3.connect(DB_NAME, isolation_level=None)
+    try:
+        externa.execute("""
+            INSERT INTO movimentacoes (id_produto, tipo, quantidade, profissional, cliente, data)
+            VALUES (1, 'Venda', 1000, 'Teste', NULL, ?)
+        """, (PERIODO[0],))
+    finally:
+        externa.close()
+    depois = consultas.consultar_indicadores(*PERIODO)
+    assert depois.total_produtos_vendidos == antes.total_produtos_vendidos + 1000
+
+
+def test_total_de_movimentacoes_acompanha_as_escritas(banco):
+    def contar():
+        return execute_query("SELECT COUNT(*) FROM movimentacoes", fetch=True)[0][0]
+
+    assert consultas.contar_historico(consultas.FiltrosHistorico()) == contar()  # e fica no cache
+    execute_query("""
+        INSERT INTO movimentacoes (id_produto, tipo, quantidade, profissional, cliente, data)
+        VALUES (1, 'Compra', 1, 'Teste', NULL, ?)
+    """, (PERIODO[0],))
+    assert consultas.contar_historico(consultas.FiltrosHistorico()) == contar()
+    execute_query("DELETE FROM movimentacoes WHERE id = (SELECT MAX(id) FROM movimentacoes)")
+    assert consultas.contar_historico(consultas.FiltrosHistorico()) == contar()
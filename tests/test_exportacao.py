@@ -0,0 +1,35 @@
+import csv
+import gzip
+import io
+
+import pytest
+
+from conftest import QUANTIDADES
+from sistema_vendas.exportacao import LimiteExportacaoExcedido, exportar
+
+
+def _linhas_csv(conteudo):
+    return list(csv.reader(io.StringIO(conteudo.decode("utf-8"))))
+
+
+def test_csv_gz_em_arquivo_de_quem_chamou(banco):
+    destino = io.BytesIO()
+    total = exportar("clientes", "csv.gz", destino, tamanho_lote=100)
+    # O arquivo de quem chamou continua aberto e o gzip está completo (com o final)
+    assert not destino.closed
+    linhas = _linhas_csv(gzip.decompress(destino.getvalue()))
+    assert total == QUANTIDADES["clientes"] == len(linhas) - 1
+    assert linhas[0][0] == "id"
+
+
+def test_csv_gz_em_caminho(banco, tmp_path):
+    destino = tmp_path / "clientes.csv.gz"
+    total = exportar("clientes", "csv.gz", destino)
+    with gzip.open(destino, "rb") as arquivo:
+        assert len(_linhas_csv(arquivo.read())) - 1 == total
+
+
+def test_limite_de_linhas(banco):
+    assert exportar("clientes", "csv", io.BytesIO(), limite=QUANTIDADES["clientes"]) == QUANTIDADES["clientes"]
+    with pytest.raises(LimiteExportacaoExcedido, match="python -m sistema_vendas.exportacao clientes"):
+        exportar("clientes", "csv", io.BytesIO(), limite=QUANTIDADES["clientes"] - 1)
@@ -0,0 +1,19 @@
+from sistema_vendas.graficos import lttb, posicoes_periodo
+
+
+def test_periodos_viram_dias():
+    dias = posicoes_periodo(["2024-01-01", "2024-01-08", "2024-02", "2024-T2", "2024-04-01"])
+    assert (dias - dias[0]).tolist() == [0, 7, 31, 91, 91]
+
+
+def test_lttb_usa_o_espacamento_real_de_x():
+    # Dias sem venda não vêm na série: o último ponto fica 17 dias depois do anterior
+    periodos = ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04", "2024-01-21"]
+    vendas = [0, 4, 0, 9, 10]
+    assert lttb(posicoes_periodo(periodos), vendas, 3).tolist() == [0, 3, 4]
+    # Com os pontos igualmente espaçados a escolha seria outra
+    assert lttb(range(5), vendas, 3).tolist() == [0, 2, 4]
+
+
+def test_lttb_mantem_series_curtas():
+    assert lttb(range(4), [1, 2, 3, 4], 10).tolist() == [0, 1, 2, 3]
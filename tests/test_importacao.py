@@ -0,0 +1,51 @@
+import io
+import sqlite3
+
+import pytest
+
+from sistema_vendas.banco import execute_query
+from sistema_vendas.importacao import importar
+
+
+def _csv(*linhas):
+    return io.StringIO("\n".join(linhas) + "\n")
+
+
+def test_preco_com_virgula_decimal(banco):
+    arquivo = _csv(
+        "nome,marca,tamanho,preco_compra,preco_venda,data_compra",
+        'Importado vírgula,Marca,M," 12,5 ",20.75,01/02/2024',
+        "Importado inválido,Marca,M,abc,20,2024-02-01",
+    )
+    (resultado, rejeitadas), = importar(arquivo, "produtos")
+    assert (resultado.importadas, resultado.rejeitadas) == (1, 1)
+    assert rejeitadas["motivo"].tolist() == ["preco_compra inválido"]
+    assert execute_query(
+        "SELECT preco_compra, preco_venda, data_compra FROM produtos WHERE nome = 'Importado vírgula'", fetch=True
+    ) == [(12.5, 20.75, "2024-02-01")]
+
+
+def test_lote_com_erro_no_banco_nao_e_gravado_pela_metade(banco):
+    # Erro que a validação não vê, só o banco
+    execute_query("""
+        CREATE TRIGGER trg_teste_importacao BEFORE INSERT ON clientes
+        WHEN NEW.nome = 'Recusado' BEGIN SELECT RAISE(ABORT, 'cliente recusado'); END
+    """)
+    arquivo = _csv(
+        "nome,cpf,endereco,email,telefone,data_nascimento",
+        "Lote um A,000.000.000-01,Rua A,a@teste.com,1111,1990-01-01",
+        "Lote um B,000.000.000-02,Rua B,b@teste.com,2222,1990-01-01",
+        "Lote dois A,000.000.000-03,Rua C,c@teste.com,3333,1990-01-01",
+        "Recusado,000.000.000-04,Rua D,d@teste.com,4444,1990-01-01",
+    )
+    try:
+        lotes = importar(arquivo, "clientes", tamanho_lote=2)
+        assert next(lotes)[0].importadas == 2
+        # O erro do comando volta pela fila de gravação para quem importou
+        with pytest.raises(sqlite3.IntegrityError, match="cliente recusado"):
+            next(lotes)
+    finally:
+        execute_query("DROP TRIGGER trg_teste_importacao")
+    assert execute_query(
+        "SELECT nome FROM clientes WHERE nome LIKE 'Lote %' ORDER BY nome", fetch=True
+    ) == [("Lote um A",), ("Lote um B",)]
@@ -0,0 +1,52 @@
+import pytest
+
+from sistema_vendas.banco import execute_query
+from sistema_vendas.planilhas import consultar_pagina_planilha, salvar_alteracoes_planilha
+
+
+def _editar(coluna, valor):
+    original = consultar_pagina_planilha("produtos", tamanho_pagina=1)
+    # O AgGrid devolve os valores editados como texto
+    atualizado = original.astype(object)
+    atualizado.loc[0, coluna] = valor
+    return original, atualizado, int(original.loc[0, "id"])
+
+
+def test_preco_editado_e_gravado_como_numero(banco):
+    original, atualizado, id_produto = _editar("preco_venda", " 12,5 ")
+    assert salvar_alteracoes_planilha("produtos", original, atualizado) == (1, [])
+    assert execute_query(
+        "SELECT preco_venda, typeof(preco_venda) FROM produtos WHERE id = ?", (id_produto,), fetch=True
+    ) == [(12.5, "real")]
+
+
+def test_texto_em_coluna_numerica_nao_e_gravado(banco):
+    original, atualizado, id_produto = _editar("preco_compra", "abc")
+    with pytest.raises(ValueError, match="preco_compra"):
+        salvar_alteracoes_planilha("produtos", original, atualizado)
+    assert execute_query(
+        "SELECT typeof(preco_compra) FROM produtos WHERE id = ?", (id_produto,), fetch=True
+    ) == [("real",)]
+
+
+def test_linha_alterada_por_outra_sessao_nao_e_sobrescrita(banco):
+    original, atualizado, id_produto = _editar("preco_venda", "99")
+    # Outra sessão grava a mesma linha depois que o bloco foi carregado
+    execute_query("UPDATE produtos SET preco_venda = 55 WHERE id = ?", (id_produto,))
+    assert salvar_alteracoes_planilha("produtos", original, atualizado) == (0, [id_produto])
+    assert execute_query("SELECT preco_venda FROM produtos WHERE id = ?", (id_produto,), fetch=True) == [(55.0,)]
+
+
+def test_alteracoes_sao_comparadas_com_o_bloco_carregado(banco):
+    original = consultar_pagina_planilha("produtos", tamanho_pagina=2)
+    (id_editado, id_outro) = original["id"].tolist()
+    # Outra sessão altera uma linha que o usuário não editou: ela não entra no
+    # UPDATE, e a edição do usuário é salva
+    execute_query("UPDATE produtos SET marca = 'Outra sessão' WHERE id = ?", (id_outro,))
+    atualizado = original.astype(object)
+    atualizado.loc[0, "nome"] = "Nome editado"
+    assert salvar_alteracoes_planilha("produtos", original, atualizado) == (1, [])
+    assert execute_query(
+        "SELECT id, nome, marca = 'Outra sessão' FROM produtos WHERE id IN (?, ?) ORDER BY id",
+        (id_editado, id_outro), fetch=True,
+    ) == sorted([(id_editado, "Nome editado", 0), (id_outro, original.loc[1, "nome"], 1)])
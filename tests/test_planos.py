@@ -0,0 +1,96 @@
+import re
+
+import pytest
+
+from conftest import PERIODO
+from sistema_vendas import consultas
+from sistema_vendas.consultas import FiltrosHistorico
+
+
+# Uso de índice (ou da chave primária) em algum passo do plano
+_USA_INDICE = re.compile(r"USING (COVERING )?INDEX|USING (INTEGER )?PRIMARY KEY")
+# Varredura de movimentacoes inteira, com ou sem índice
+_VARRE_MOVIMENTACOES = re.compile(r"\bSCAN (movimentacoes|m)\b")
+
+CONSULTAS = {
+    "indicadores": lambda: consultas.consultar_indicadores(*PERIODO),
+    **{
+        f"vendas_periodo[{granularidade}]": lambda g=granularidade: consultas.consultar_vendas_periodo(*PERIODO, g)
+        for granularidade in consultas.GRANULARIDADES
+    },
+    **{
+        f"custos_periodo[{granularidade}]": lambda g=granularidade: consultas.consultar_custos_periodo(*PERIODO, g)
+        for granularidade in consultas.GRANULARIDADES
+    },
+    "vendas_por_marca": lambda: consultas.consultar_vendas_por_marca(*PERIODO),
+    "vendas_por_tamanho": lambda: consultas.consultar_vendas_por_tamanho(*PERIODO),
+    "estoque": consultas.consultar_estoque,
+}
+
+# Filtros do histórico; cada um é consultado na primeira página e em uma página seguinte
+FILTROS_HISTORICO = {
+    "sem filtro": FiltrosHistorico(),
+    "produto": FiltrosHistorico(id_produto=3),
+    "tipo": FiltrosHistorico(tipo="Venda"),
+    "produto e tipo": FiltrosHistorico(id_produto=3, tipo="Compra"),
+    "período": FiltrosHistorico(data_inicio="2024-03-01", data_fim="2024-03-31"),
+    "profissional": FiltrosHistorico(profissional="Ana"),
+}
+
+
+# Planos dos comandos executados pela função, capturados pela instrumentação
+# (com limite zero todo comando entra no histórico de lentas, com o plano)
+def _planos(db, funcao):
+    db.cache.invalidar()
+    db.instrumentacao.limpar()
+    limite = db.instrumentacao.limite_ms
+    db.instrumentacao.limite_ms = 0
+    try:
+        funcao()
+    finally:
+        db.instrumentacao.limite_ms = limite
+    planos = [lenta["plano"] for lenta in db.instrumentacao.lentas()]
+    assert planos, "nenhum comando executado"
+    return planos
+
+
+def _conferir(planos):
+    for plano in planos:
+        texto = "\n".join(plano)
+        assert _USA_INDICE.search(texto), texto
+        assert not _VARRE_MOVIMENTACOES.search(texto), texto
+
+
+@pytest.mark.parametrize("nome", CONSULTAS)
+def test_consultas_do_dashboard_e_estoque_usam_indices(banco, nome):
+    _conferir(_planos(banco, CONSULTAS[nome]))
+
+
+@pytest.mark.parametrize("antes_de_id", [None, 4000], ids=["primeira página", "página seguinte"])
+@pytest.mark.parametrize("nome", FILTROS_HISTORICO)
+def test_historico_usa_indices_sem_ordenar(banco, nome, antes_de_id):
+    planos = _planos(banco, lambda: consultas.consultar_historico(FILTROS_HISTORICO[nome], antes_de_id))
+    _conferir(planos)
+    # A paginação por chave percorre o índice já na ordem do id. O prefixo do
+    # profissional é um intervalo no índice, fora da ordem do id: só os ids
+    # encontrados são ordenados (veja test_filtro_de_profissional_usa_o_indice_do_nome).
+    if nome != "profissional":
+        for plano in planos:
+            assert not any("TEMP B-TREE" in passo for passo in plano), plano
+
+
+@pytest.mark.parametrize("nome", [nome for nome in FILTROS_HISTORICO if nome != "sem filtro"])
+def test_contagem_do_historico_filtrado_usa_indices(banco, nome):
+    _conferir(_planos(banco, lambda: consultas.contar_historico(FILTROS_HISTORICO[nome])))
+
+
+@pytest.mark.parametrize("funcao", [consultas.consultar_historico, consultas.contar_historico])
+def test_filtro_de_profissional_usa_o_indice_do_nome(banco, funcao):
+    (plano,) = _planos(banco, lambda: funcao(FILTROS_HISTORICO["profissional"]))
+    assert any("COVERING INDEX idx_movimentacoes_profissional (profissional>? AND profissional<?)" in passo
+               for passo in plano), plano
+
+
+def test_total_sem_filtros_nao_le_movimentacoes(banco):
+    (plano,) = _planos(banco, lambda: consultas.contar_historico(FiltrosHistorico()))
+    assert all("contagem_movimentacoes" in passo for passo in plano), plano